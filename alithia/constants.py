@@ -20,6 +20,9 @@ DEFAULT_ARXIV_QUERY = "cs.AI+cs.CV+cs.LG+cs.CL"
 # Whether to send email when no papers are found
 DEFAULT_SEND_EMPTY = False
 
+# Default directory for the on-disk cache of reranker scores
+DEFAULT_RERANK_CACHE_DIR = "~/.cache/alithia/paperscout"
+
 
 # ===========================
 # ArXiv Fetcher Defaults
@@ -39,6 +42,13 @@ ARXIV_BATCH_SIZE = 50
 # ArXiv page size for web scraping
 ARXIV_PAGE_SIZE = 50
 
+# Minimum interval between requests to the same ArXiv host (arXiv asks for at most one request every 3 seconds)
+ARXIV_REQUEST_INTERVAL = 3.0  # seconds
+
+# Directory and lifetime of the on-disk cache of scraped ArXiv pages (used if requests-cache is installed)
+DEFAULT_ARXIV_CACHE_DIR = "~/.cache/alithia/arxiv"
+ARXIV_CACHE_EXPIRE_AFTER = 3600  # seconds
+
 
 # ===========================
 # PaperLens Agent Defaults
@@ -50,6 +60,9 @@ DEFAULT_SBERT_MODEL = "all-MiniLM-L6-v2"
 # Default number of top papers to display
 DEFAULT_TOP_N = 10
 
+# Default directory for PaperLens on-disk caches (embeddings, etc.)
+DEFAULT_PAPERLENS_CACHE_DIR = "~/.cache/alithia/paperlens"
+
 
 # ===========================
 # Storage Defaults
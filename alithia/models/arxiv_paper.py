@@ -1,4 +1,5 @@
 import re
+import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -39,7 +40,8 @@ class ArxivPaper(BaseModel):
         return cls(
             title=paper_result.title.strip(),
             summary=paper_result.summary.strip(),
-            authors=[author.name for author in paper_result.authors],
+            # Interned so that recurring authors share one string across papers
+            authors=[sys.intern(author.name) for author in paper_result.authors],
             arxiv_id=arxiv_id,
             pdf_url=paper_result.pdf_url,
             published_date=paper_result.published,
@@ -0,0 +1,128 @@
+"""
+Persistent embedding cache for PaperLens.
+
+Paper embeddings are stored in a small SQLite database keyed by
+(model name, content hash), so repeated runs over the same corpus only
+encode papers that are new or have changed. Vectors can optionally be
+stored as int8 with a per-vector scale, shrinking the cache about 4x.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from alithia.constants import DEFAULT_PAPERLENS_CACHE_DIR
+
+
+class EmbeddingCache:
+    """SQLite-backed key-value store of embedding vectors."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, quantize: bool = False):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+                       (defaults to DEFAULT_PAPERLENS_CACHE_DIR)
+            quantize: Store new vectors as int8 with a per-vector scale instead of float32
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_PAPERLENS_CACHE_DIR).expanduser()
+        self.db_path = self.cache_dir / "embeddings.sqlite"
+        self.quantize = quantize
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self.conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    precision TEXT NOT NULL DEFAULT 'float32',
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, key)
+                )
+                """
+            )
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(embeddings)")}
+            if "precision" not in columns:
+                # Caches created before quantization support only hold float32 vectors
+                self.conn.execute("ALTER TABLE embeddings ADD COLUMN precision TEXT NOT NULL DEFAULT 'float32'")
+        return self.conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    @staticmethod
+    def _encode_vector(vector: np.ndarray, precision: str) -> bytes:
+        """Serialize a vector; int8 blobs are a float32 scale followed by the int8 values."""
+        vector = np.asarray(vector, dtype=np.float32)
+        if precision == "int8":
+            scale = np.float32(np.abs(vector).max() / 127.0) if vector.size else np.float32(0.0)
+            quantized = np.round(vector / scale) if scale > 0 else np.zeros_like(vector)
+            return scale.tobytes() + quantized.astype(np.int8).tobytes()
+        return vector.tobytes()
+
+    @staticmethod
+    def _decode_vector(blob: bytes, precision: str) -> np.ndarray:
+        """Deserialize a vector to float32."""
+        if precision == "int8":
+            scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+            return np.frombuffer(blob, dtype=np.int8, offset=4).astype(np.float32) * scale
+        return np.frombuffer(blob, dtype=np.float32)
+
+    def get_many(self, model: str, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            model: Embedding model name
+            keys: Cache keys (e.g. content hashes)
+
+        Returns:
+            Mapping of key to embedding for the keys found in the cache
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        conn = self._connect()
+        found = {}
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            batch = keys[i : i + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, precision, vector FROM embeddings WHERE model = ? AND key IN ({placeholders})",
+                (model, *batch),
+            )
+            for key, precision, blob in rows:
+                found[key] = self._decode_vector(blob, precision)
+        return found
+
+    def put_many(self, model: str, embeddings: Dict[str, np.ndarray]) -> None:
+        """
+        Store embeddings.
+
+        Args:
+            model: Embedding model name
+            embeddings: Mapping of cache key to embedding vector
+        """
+        if not embeddings:
+            return
+
+        precision = "int8" if self.quantize else "float32"
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, key, precision, vector) VALUES (?, ?, ?, ?)",
+                [(model, key, precision, self._encode_vector(vector, precision)) for key, vector in embeddings.items()],
+            )
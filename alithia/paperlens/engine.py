@@ -6,14 +6,26 @@ using semantic similarity matching.
 """
 
 import hashlib
+import os
+import pickle
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import datetime
+from functools import cached_property
+from multiprocessing import get_context
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from cogents_core.utils import get_logger
 
+from alithia.paperlens.embedding_cache import EmbeddingCache
 from alithia.paperlens.paper_ocr.docling import DoclingOcr
+from alithia.paperlens.paper_ocr.extraction_cache import ExtractionCache
+from alithia.paperlens.topic_cache import TopicCache
 from alithia.storage.base import StorageBackend
+from alithia.utils.file_utils import compute_file_hash, iter_files
 
 logger = get_logger(__name__)
 
@@ -36,6 +48,53 @@ from alithia.paperlens.models import (
     PaperMetadata,
 )
 
+# Number of paper texts encoded per forward pass
+ENCODE_BATCH_SIZE = 64
+
+# Number of threads used to hash PDFs ahead of parsing
+HASH_WORKERS = 8
+
+# Token cap for the embedding model; longer paper texts are truncated
+MAX_SEQ_LENGTH = 256
+
+# Weight of each paper field (see AcademicPaper.get_field_texts) in the similarity score
+FIELD_WEIGHTS = {"title": 3.0, "abstract": 2.0, "keywords": 1.0, "body": 1.0}
+
+# Version of the paper embeddings (field texts and weights).
+# Part of the cache namespace so that changing it invalidates cached embeddings and scores.
+EMBEDDING_TEXT_VERSION = "v3"
+
+# Per-process OCR instance used by pool workers (see `_init_parse_worker`)
+_WORKER_OCR: Optional[DoclingOcr] = None
+
+
+def _init_parse_worker(llm=None, extraction_cache: Optional[ExtractionCache] = None) -> None:
+    """Initialize the DoclingOcr of a parsing worker process."""
+    global _WORKER_OCR
+    _WORKER_OCR = DoclingOcr(llm=llm, extraction_cache=extraction_cache)
+
+
+def _parse_pdf_worker(pdf_path: Path, content_hash: Optional[str] = None) -> Tuple[Optional[AcademicPaper], bool]:
+    """Parse a single PDF inside a parsing worker process, leaving LLM enhancement to the caller."""
+    return _WORKER_OCR.parse_file_without_llm(pdf_path, content_hash=content_hash)
+
+
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embedding rows so inner products are cosine similarities."""
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def _top_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the ``top_n`` highest scores, best first."""
+    if top_n < len(scores):
+        # O(N) selection of the top candidates, then sort only those
+        idx = np.argpartition(-scores, top_n - 1)[:top_n]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
 
 class PaperLensEngine:
     """Core engine for paper analysis and ranking."""
@@ -44,9 +103,15 @@ class PaperLensEngine:
         self,
         sbert_model: str = "all-MiniLM-L6-v2",
         force_gpu: bool = False,
+        force_cpu: bool = False,
         llm=None,
         storage: Optional[StorageBackend] = None,
         user_id: str = "default_user",
+        use_embedding_cache: bool = True,
+        cache_dir: Optional[Path] = None,
+        use_topic_cache: bool = False,
+        quantize_embeddings: bool = False,
+        use_extraction_cache: bool = True,
     ):
         """
         Initialize the PaperLens engine.
@@ -54,54 +119,82 @@ class PaperLensEngine:
         Args:
             sbert_model: Name of the sentence-transformer model to use.
                        Default is 'all-MiniLM-L6-v2' which is fast and efficient.
-            force_gpu: Force GPU usage even if CUDA compatibility issues are detected.
+            force_gpu: Warn if no GPU is available (a GPU is used by default whenever CUDA is available).
+            force_cpu: Run the model on CPU even if a GPU is available.
             llm: Optional LLM client for enhanced metadata extraction.
             storage: Optional storage backend for caching parsed papers.
             user_id: User identifier for storage isolation.
+            use_embedding_cache: Whether to reuse paper embeddings across runs from an on-disk cache.
+            cache_dir: Directory for the on-disk caches (defaults to DEFAULT_PAPERLENS_CACHE_DIR).
+            use_topic_cache: Whether to reuse the scores of a similar earlier topic over the same papers (approximate).
+            quantize_embeddings: Store cached embeddings as int8 (about 4x smaller, slightly lossy).
+            use_extraction_cache: Whether to reuse parse results of unchanged PDFs from an on-disk cache.
 
         Note:
-            This engine uses IBM Granite Docling 258M model for PDF parsing and layout analysis.
+            This engine uses docling with the pypdfium backend (OCR disabled) for PDF parsing.
+            The embedding model and the PDF parser are only loaded when first needed.
         """
-        import os
+        self.sbert_model = sbert_model
+        self.force_gpu = force_gpu
+        self.force_cpu = force_cpu
+        if force_cpu:
+            # Hide GPUs entirely to sidestep CUDA compatibility issues
+            os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
-        import torch
+        self.cache_namespace = f"{sbert_model}@{EMBEDDING_TEXT_VERSION}"
+        self.embedding_cache = EmbeddingCache(cache_dir, quantize=quantize_embeddings) if use_embedding_cache else None
+        self.topic_cache = TopicCache(cache_dir) if use_topic_cache else None
+        self.extraction_cache = ExtractionCache(cache_dir) if use_extraction_cache else None
+        self._topic_embeddings: Dict[str, np.ndarray] = {}
 
-        # Handle GPU/CPU device selection
-        if force_gpu:
-            logger.info("Force GPU mode enabled")
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            if device == "cpu":
-                logger.warning("GPU requested but CUDA not available, falling back to CPU")
-        else:
-            # Default behavior: use CPU to avoid CUDA compatibility issues
-            device = "cpu"
-            os.environ["CUDA_VISIBLE_DEVICES"] = ""
+        # Normalized embeddings of the last scored corpus (rows) and their content hashes
+        self._emb: Optional[np.ndarray] = None
+        self._paper_ids: List[str] = []
 
-        logger.info(f"Loading sentence transformer model: {sbert_model} (device: {device})")
-        self.model = SentenceTransformer(sbert_model, device=device)
+        # Seconds spent loading the sentence transformer (set on first use of self.model)
+        self.model_load_seconds: Optional[float] = None
 
         self.llm = llm
-        self.ocr = DoclingOcr(llm=self.llm)
         self.storage = storage
         self.user_id = user_id
 
         if self.storage:
             logger.info("Storage backend enabled for paper caching")
 
-        logger.info(f"PaperLens engine initialized (device: {device})")
+        logger.info("PaperLens engine initialized")
+
+    @cached_property
+    def model(self) -> SentenceTransformer:
+        """Sentence transformer, loaded on first use."""
+        import torch
+
+        # Handle GPU/CPU device selection
+        if self.force_cpu:
+            device = "cpu"
+        else:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            if self.force_gpu and device == "cpu":
+                logger.warning("GPU requested but CUDA not available, falling back to CPU")
 
-    def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute MD5 hash of a file."""
-        md5_hash = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-        return md5_hash.hexdigest()
+        logger.info(f"Loading sentence transformer model: {self.sbert_model} (device: {device})")
+        start = time.perf_counter()
+        model = SentenceTransformer(self.sbert_model, device=device)
+        if device == "cuda":
+            # fp16 halves memory traffic of the forward pass on GPU
+            model.half()
+        model.max_seq_length = min(model.max_seq_length or MAX_SEQ_LENGTH, MAX_SEQ_LENGTH)
+        # Reported separately so model loading is not mistaken for encoding time
+        self.model_load_seconds = time.perf_counter() - start
+        logger.info(f"Loaded sentence transformer model in {self.model_load_seconds:.2f}s")
+        return model
+
+    @cached_property
+    def ocr(self) -> DoclingOcr:
+        """PDF parser for serial parsing, created on first use."""
+        return DoclingOcr(llm=self.llm, extraction_cache=self.extraction_cache)
 
     def _cached_paper_to_model(self, cached_data: dict, pdf_path: Path) -> AcademicPaper:
         """Convert cached paper data back to AcademicPaper model."""
-        from datetime import datetime
-
         file_stats = pdf_path.stat()
 
         file_metadata = FileMetadata(
@@ -109,7 +202,7 @@ class PaperLensEngine:
             file_name=pdf_path.name,
             file_size=file_stats.st_size,
             last_modified=datetime.fromtimestamp(file_stats.st_mtime),
-            md5_hash=cached_data.get("file_hash"),
+            content_hash=cached_data.get("file_hash"),
         )
 
         paper_metadata = PaperMetadata(
@@ -132,12 +225,13 @@ class PaperLensEngine:
             parse_timestamp=datetime.fromisoformat(cached_data.get("parsed_at")),
         )
 
-    def parse_file(self, pdf_path: Path) -> AcademicPaper:
+    def parse_file(self, pdf_path: Path, content_hash: Optional[str] = None) -> AcademicPaper:
         """
         Parse a single PDF file with caching support.
 
         Args:
             pdf_path: Path to the PDF file
+            content_hash: Precomputed content hash of the file (computed if omitted)
 
         Returns:
             Parsed AcademicPaper object or None if parsing fails
@@ -145,8 +239,9 @@ class PaperLensEngine:
         # Check cache if storage is available
         if self.storage:
             try:
-                file_hash = self._compute_file_hash(pdf_path)
-                cached_paper = self.storage.get_parsed_paper(self.user_id, file_hash)
+                if content_hash is None:
+                    content_hash = compute_file_hash(pdf_path)
+                cached_paper = self.storage.get_parsed_paper(self.user_id, content_hash)
 
                 if cached_paper:
                     logger.info(f"Using cached paper for {pdf_path.name}")
@@ -155,16 +250,15 @@ class PaperLensEngine:
                 logger.warning(f"Failed to check cache for {pdf_path.name}: {e}")
 
         # Parse the PDF
-        paper = self.ocr.parse_file(pdf_path)
+        paper = self.ocr.parse_file(pdf_path, content_hash=content_hash)
 
         # Cache the result if storage is available
         if paper and self.storage:
             try:
-                file_hash = self._compute_file_hash(pdf_path)
                 paper_data = {
                     "file_path": str(paper.file_metadata.file_path),
                     "file_name": paper.file_metadata.file_name,
-                    "file_hash": file_hash,
+                    "file_hash": paper.file_metadata.content_hash,
                     "title": paper.paper_metadata.title,
                     "authors": paper.paper_metadata.authors,
                     "abstract": paper.paper_metadata.abstract,
@@ -181,13 +275,24 @@ class PaperLensEngine:
 
         return paper
 
-    def scan_pdf_directory(self, directory: Path, recursive: bool = True) -> List[AcademicPaper]:
+    def scan_pdf_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        max_workers: Optional[int] = None,
+        min_size: int = 1,
+        max_size: Optional[int] = None,
+    ) -> List[AcademicPaper]:
         """
         Scan a directory for PDF files and parse them.
 
         Args:
             directory: Directory containing PDF files
             recursive: Whether to search subdirectories
+            max_workers: Number of parsing processes. Defaults to half the CPU count;
+                       use 1 to parse serially in the current process.
+            min_size: Skip PDFs smaller than this many bytes (empty files by default)
+            max_size: Skip PDFs larger than this many bytes (no limit if None)
 
         Returns:
             List of successfully parsed AcademicPaper objects
@@ -203,20 +308,158 @@ class PaperLensEngine:
             return []
 
         # Find all PDF files
-        pattern = "**/*.pdf" if recursive else "*.pdf"
-        pdf_files = list(directory.glob(pattern))
+        pdf_files = list(iter_files(directory, ".pdf", recursive=recursive, min_size=min_size, max_size=max_size))
         logger.info(f"Found {len(pdf_files)} PDF files")
 
+        # Hash all files up front so parsers don't have to re-read them for it
+        content_hashes = self._hash_files(pdf_files)
+
+        # Parse only one file per distinct content; unreadable files (no hash) are kept as is
+        representatives = {}
+        for i, content_hash in enumerate(content_hashes):
+            representatives.setdefault(content_hash if content_hash else ("unhashed", i), i)
+        unique_indices = list(representatives.values())
+        if len(unique_indices) < len(pdf_files):
+            logger.info(f"Skipping {len(pdf_files) - len(unique_indices)} duplicate PDFs")
+        unique_files = [pdf_files[i] for i in unique_indices]
+        unique_hashes = [content_hashes[i] for i in unique_indices]
+
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) // 2)
+        max_workers = min(max_workers, len(unique_files))
+
+        if max_workers > 1 and not self._is_llm_picklable():
+            logger.warning("LLM client cannot be sent to worker processes, parsing serially")
+            max_workers = 1
+
         # Parse each PDF
+        if max_workers > 1:
+            results = self._parse_pdfs_parallel(unique_files, unique_hashes, max_workers)
+        else:
+            results = [
+                self.ocr.parse_file_without_llm(pdf_path, content_hash=content_hash)
+                for pdf_path, content_hash in zip(unique_files, unique_hashes)
+            ]
+
+        # Enhance incomplete metadata with concurrent LLM calls once all PDFs are parsed
+        self.ocr.enhance_metadata_with_llm([paper for paper, needs_llm in results if needs_llm])
+
+        parsed_by_index = dict(zip(unique_indices, (paper for paper, _ in results)))
+
+        # Give every duplicate its own copy of the representative's result
         papers = []
-        for pdf_path in pdf_files:
-            paper = self.ocr.parse_file(pdf_path)
+        for i, (pdf_path, content_hash) in enumerate(zip(pdf_files, content_hashes)):
+            if i in parsed_by_index:
+                paper = parsed_by_index[i]
+            else:
+                paper = self._copy_for_duplicate(parsed_by_index[representatives[content_hash]], pdf_path)
             if paper:
                 papers.append(paper)
 
         logger.info(f"Successfully parsed {len(papers)} out of {len(pdf_files)} PDFs")
         return papers
 
+    @staticmethod
+    def _copy_for_duplicate(paper: Optional[AcademicPaper], pdf_path: Path) -> Optional[AcademicPaper]:
+        """Copy a parsed paper for another file with identical content."""
+        if paper is None:
+            return None
+
+        stat = pdf_path.stat()
+        file_metadata = paper.file_metadata.model_copy(
+            update={
+                "file_path": pdf_path,
+                "file_name": pdf_path.name,
+                "last_modified": datetime.fromtimestamp(stat.st_mtime),
+            }
+        )
+        return paper.model_copy(update={"file_metadata": file_metadata}, deep=True)
+
+    def _is_llm_picklable(self) -> bool:
+        """Check whether the LLM client can be shipped to worker processes."""
+        if self.llm is None:
+            return True
+        try:
+            pickle.dumps(self.llm)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _hash_files(pdf_files: List[Path]) -> List[Optional[str]]:
+        """
+        Compute content hashes of files concurrently.
+
+        Hashing is I/O bound and the hash functions release the GIL, so a thread pool
+        keeps several reads in flight at once.
+
+        Args:
+            pdf_files: Files to hash
+
+        Returns:
+            Content hashes in the same order as ``pdf_files`` (None for unreadable files)
+        """
+
+        def hash_file(pdf_path: Path) -> Optional[str]:
+            try:
+                return compute_file_hash(pdf_path)
+            except OSError as e:
+                logger.warning(f"Failed to hash {pdf_path.name}: {e}")
+                return None
+
+        if len(pdf_files) <= 1:
+            return [hash_file(pdf_path) for pdf_path in pdf_files]
+
+        with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(pdf_files))) as executor:
+            return list(executor.map(hash_file, pdf_files))
+
+    def _parse_pdfs_parallel(
+        self, pdf_files: List[Path], content_hashes: List[Optional[str]], max_workers: int
+    ) -> List[Tuple[Optional[AcademicPaper], bool]]:
+        """
+        Parse PDFs across a pool of worker processes.
+
+        Each worker builds its own DoclingOcr (and docling converter) once, so no
+        models are pickled from the main process. At most ``2 * max_workers`` parses
+        are in flight at a time to bound the memory held by pending results.
+
+        Args:
+            pdf_files: PDF files to parse
+            content_hashes: Precomputed content hashes of ``pdf_files``
+            max_workers: Number of worker processes
+
+        Returns:
+            Results of DoclingOcr.parse_file_without_llm in the same order as ``pdf_files``
+        """
+        logger.info(f"Parsing {len(pdf_files)} PDFs with {max_workers} worker processes")
+        results: List[Tuple[Optional[AcademicPaper], bool]] = [(None, False)] * len(pdf_files)
+        max_in_flight = 2 * max_workers
+
+        # Spawn (rather than fork) so workers don't inherit the parent's torch threads
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(self.llm, self.extraction_cache),
+        ) as executor:
+            pending = {}
+            next_index = 0
+            while next_index < len(pdf_files) or pending:
+                while next_index < len(pdf_files) and len(pending) < max_in_flight:
+                    future = executor.submit(_parse_pdf_worker, pdf_files[next_index], content_hashes[next_index])
+                    pending[future] = next_index
+                    next_index += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker failed to parse {pdf_files[index].name}: {e}")
+
+        return results
+
     def calculate_similarity(self, research_topic: str, papers: List[AcademicPaper]) -> List[AcademicPaper]:
         """
         Calculate similarity scores between research topic and papers.
@@ -232,28 +475,216 @@ class PaperLensEngine:
             logger.warning("No papers to calculate similarity for")
             return papers
 
+        scores = self.score_papers(research_topic, papers)
+
+        # Update similarity scores (tolist converts to Python floats in one pass)
+        for paper, score in zip(papers, scores.tolist()):
+            paper.similarity_score = score
+
+        return papers
+
+    def score_papers(self, research_topic: str, papers: List[AcademicPaper]) -> np.ndarray:
+        """
+        Compute cosine similarity between the research topic and each paper.
+
+        Unlike ``calculate_similarity``, the papers are left untouched, so callers that only
+        need the top results can avoid setting a score on every paper.
+
+        Args:
+            research_topic: The research topic string
+            papers: List of AcademicPaper objects
+
+        Returns:
+            Array of similarity scores aligned with ``papers``
+        """
+        if not papers:
+            return np.empty(0, dtype=np.float32)
+
         logger.info(f"Calculating similarity for {len(papers)} papers")
 
         # Encode the research topic
-        topic_embedding = self.model.encode(research_topic, convert_to_tensor=True)
+        topic_embedding = self._encode_topic(research_topic)
+
+        # Reuse scores of a near-identical earlier topic over the same corpus
+        keys = [paper.file_metadata.content_hash for paper in papers]
+        corpus_order = corpus_key = None
+        if self.topic_cache and all(keys):
+            corpus_order = np.array(sorted(range(len(papers)), key=keys.__getitem__))
+            corpus_key = self._corpus_fingerprint([keys[i] for i in corpus_order])
+            try:
+                cached_scores = self.topic_cache.lookup(self.cache_namespace, corpus_key, topic_embedding)
+            except Exception as e:
+                logger.warning(f"Failed to read topic cache: {e}")
+                cached_scores = None
+
+            if cached_scores is not None and len(cached_scores) == len(papers):
+                logger.info("Reusing approximate similarity scores from a similar cached topic")
+                scores = np.empty(len(papers), dtype=np.float32)
+                scores[corpus_order] = cached_scores
+                return scores
 
-        # Encode all paper texts
-        paper_texts = [paper.get_searchable_text() for paper in papers]
+        # Calculate cosine similarity with one matrix-vector product
+        scores = self._paper_matrix(papers) @ topic_embedding
 
-        # Batch encode for efficiency
-        logger.info("Encoding paper contents...")
-        paper_embeddings = self.model.encode(paper_texts, convert_to_tensor=True, show_progress_bar=True)
+        if corpus_key:
+            try:
+                self.topic_cache.store(self.cache_namespace, corpus_key, topic_embedding, scores[corpus_order])
+            except Exception as e:
+                logger.warning(f"Failed to write topic cache: {e}")
 
-        # Calculate cosine similarity
-        from sentence_transformers import util
+        return scores
 
-        similarities = util.cos_sim(topic_embedding, paper_embeddings)[0]
+    @staticmethod
+    def _corpus_fingerprint(sorted_keys: List[str]) -> str:
+        """Fingerprint a corpus by its sorted paper content hashes."""
+        return hashlib.blake2b("\n".join(sorted_keys).encode(), digest_size=16).hexdigest()
 
-        # Update similarity scores
-        for paper, score in zip(papers, similarities):
-            paper.similarity_score = float(score)
+    def _encode_topic(self, research_topic: str) -> np.ndarray:
+        """
+        Encode a research topic, reusing earlier encodings from memory or the embedding cache.
 
-        return papers
+        Args:
+            research_topic: The research topic string
+
+        Returns:
+            L2-normalized topic embedding
+        """
+        key = hashlib.blake2b(research_topic.encode("utf-8"), digest_size=16).hexdigest()
+        if key in self._topic_embeddings:
+            return self._topic_embeddings[key]
+
+        namespace = f"{self.cache_namespace}:topic"
+        embedding = None
+        if self.embedding_cache:
+            try:
+                embedding = self.embedding_cache.get_many(namespace, [key]).get(key)
+            except Exception as e:
+                logger.warning(f"Failed to read embedding cache: {e}")
+
+        if embedding is None:
+            embedding = _normalize_rows(self.model.encode([research_topic], convert_to_numpy=True))[0]
+            if self.embedding_cache:
+                try:
+                    self.embedding_cache.put_many(namespace, {key: embedding})
+                except Exception as e:
+                    logger.warning(f"Failed to write embedding cache: {e}")
+
+        self._topic_embeddings[key] = embedding
+        return embedding
+
+    def _paper_matrix(self, papers: List[AcademicPaper]) -> np.ndarray:
+        """
+        Get the embedding matrix of the papers (see ``_encode_papers``).
+
+        The matrix is kept on the engine together with the content hashes of its rows,
+        so scoring the same corpus against several topics encodes it once.
+
+        Args:
+            papers: List of AcademicPaper objects
+
+        Returns:
+            Contiguous float32 array of shape (len(papers), dim), rows aligned with ``papers``
+        """
+        paper_ids = [paper.file_metadata.content_hash for paper in papers]
+        if self._emb is not None and all(paper_ids) and paper_ids == self._paper_ids:
+            return self._emb
+
+        embeddings = np.ascontiguousarray(self._encode_papers(papers), dtype=np.float32)
+        if all(paper_ids):
+            self._emb, self._paper_ids = embeddings, paper_ids
+        return embeddings
+
+    def _encode_papers(self, papers: List[AcademicPaper]) -> np.ndarray:
+        """
+        Encode papers, only running the model on papers missing from the embedding cache.
+
+        Each paper vector is the FIELD_WEIGHTS-weighted mean of the normalized embeddings
+        of its non-empty fields, so its dot product with a normalized topic embedding is
+        the weighted mean of the per-field cosine similarities.
+
+        Args:
+            papers: List of AcademicPaper objects
+
+        Returns:
+            Array of shape (len(papers), dim) with one embedding per paper
+        """
+        keys = [paper.file_metadata.content_hash for paper in papers]
+        cached = {}
+        if self.embedding_cache:
+            try:
+                cached = self.embedding_cache.get_many(self.cache_namespace, [key for key in keys if key])
+            except Exception as e:
+                logger.warning(f"Failed to read embedding cache: {e}")
+
+        miss_indices = [i for i, key in enumerate(keys) if key not in cached]
+        logger.info(f"Encoding paper contents ({len(miss_indices)} new, {len(papers) - len(miss_indices)} cached)...")
+
+        new_embeddings = {}
+        if miss_indices:
+            new_embeddings = dict(zip(miss_indices, self._encode_fields([papers[i] for i in miss_indices])))
+
+            if self.embedding_cache:
+                to_store = {keys[i]: emb for i, emb in new_embeddings.items() if keys[i]}
+                try:
+                    self.embedding_cache.put_many(self.cache_namespace, to_store)
+                except Exception as e:
+                    logger.warning(f"Failed to write embedding cache: {e}")
+
+        return np.stack([new_embeddings[i] if i in new_embeddings else cached[key] for i, key in enumerate(keys)])
+
+    def _encode_fields(self, papers: List[AcademicPaper]) -> np.ndarray:
+        """
+        Encode the fields of papers in one batched pass and combine them per paper.
+
+        Args:
+            papers: List of AcademicPaper objects
+
+        Returns:
+            Array of shape (len(papers), dim) of weighted mean field embeddings
+        """
+        rows, weights, texts = [], [], []
+        for row, paper in enumerate(papers):
+            fields = {field: text for field, text in paper.get_field_texts().items() if text} or {"body": ""}
+            for field, text in fields.items():
+                rows.append(row)
+                weights.append(FIELD_WEIGHTS[field])
+                texts.append(text)
+
+        encoded = _normalize_rows(
+            self.model.encode(texts, batch_size=ENCODE_BATCH_SIZE, convert_to_numpy=True, show_progress_bar=True)
+        )
+        weights = np.asarray(weights, dtype=np.float32)
+
+        combined = np.zeros((len(papers), encoded.shape[1]), dtype=np.float32)
+        np.add.at(combined, rows, encoded * weights[:, None])
+        return combined / np.bincount(rows, weights=weights, minlength=len(papers))[:, None].astype(np.float32)
+
+    def search(self, research_topic: str, papers: List[AcademicPaper], top_n: int = 10) -> List[AcademicPaper]:
+        """
+        Find the top N papers for a research topic.
+
+        Equivalent to ``calculate_similarity`` followed by ``rank_papers``, except that only
+        the returned papers get their similarity scores updated.
+
+        Args:
+            research_topic: The research topic string
+            papers: List of AcademicPaper objects
+            top_n: Number of top papers to return
+
+        Returns:
+            Sorted list of top N papers
+        """
+        if not papers:
+            logger.warning("No papers to calculate similarity for")
+            return []
+        if top_n <= 0:
+            return []
+
+        scores = self.score_papers(research_topic, papers)
+        top_indices = _top_indices(scores, top_n)
+        for i in top_indices:
+            papers[i].similarity_score = float(scores[i])
+        return [papers[i] for i in top_indices]
 
     def rank_papers(self, papers: List[AcademicPaper], top_n: int = 10) -> List[AcademicPaper]:
         """
@@ -266,5 +697,8 @@ class PaperLensEngine:
         Returns:
             Sorted list of top N papers
         """
-        sorted_papers = sorted(papers, key=lambda p: p.similarity_score, reverse=True)
-        return sorted_papers[:top_n]
+        if top_n <= 0 or not papers:
+            return []
+
+        scores = np.fromiter((p.similarity_score for p in papers), dtype=np.float32, count=len(papers))
+        return [papers[i] for i in _top_indices(scores, top_n)]
@@ -1,10 +1,40 @@
 """Data models for paperlens."""
 
+import codecs
+import re
+import warnings
+import zlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
 
-from pydantic import BaseModel, Field
+import pydantic_core
+from pydantic import AliasChoices, BaseModel, Field, PrivateAttr, computed_field, field_validator
+
+try:
+    import orjson
+except ImportError:
+    # Optional: faster JSON serialization (pip install orjson)
+    orjson = None
+
+# Bare DOI: "10.", registrant code, "/", suffix (searched for, so URL and "doi:" prefixes are dropped)
+_DOI_RE = re.compile(r"10\.\d{4,9}/\S+")
+
+# Bytes of full text decompressed per chunk when streaming it (AcademicPaper.write_json)
+FULL_TEXT_CHUNK_BYTES = 1 << 20
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Reduce a DOI, DOI URL or "doi:" reference to its bare ``10.xxxx/suffix`` form, or None if it has none."""
+    match = _DOI_RE.search(doi) if doi else None
+    return match.group().rstrip(".,;") if match else None
+
+
+def _dump_json(value: Any, indent: bool = False) -> bytes:
+    """Serialize a plain value (as produced by model_dump) to UTF-8 JSON."""
+    if orjson is None:
+        return pydantic_core.to_json(value, indent=2 if indent else None)
+    return orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2 if indent else None)
 
 
 class FileMetadata(BaseModel):
@@ -14,10 +44,22 @@ class FileMetadata(BaseModel):
     file_name: str
     file_size: int = Field(..., description="File size in bytes")
     last_modified: datetime
-    md5_hash: Optional[str] = None
+    content_hash: Optional[str] = Field(
+        None,
+        description="Content hash of the file (BLAKE3)",
+        # Accept data serialized before the field was renamed from md5_hash
+        validation_alias=AliasChoices("content_hash", "md5_hash"),
+    )
 
     class Config:
         arbitrary_types_allowed = True
+        populate_by_name = True
+
+    @property
+    def md5_hash(self) -> Optional[str]:
+        """Deprecated alias of content_hash (the file is no longer hashed with MD5)."""
+        warnings.warn("FileMetadata.md5_hash is deprecated, use content_hash instead", DeprecationWarning, stacklevel=2)
+        return self.content_hash
 
 
 class PaperMetadata(BaseModel):
@@ -34,19 +76,60 @@ class PaperMetadata(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    @field_validator("doi")
+    @classmethod
+    def _normalize_doi(cls, value: Optional[str]) -> Optional[str]:
+        return normalize_doi(value)
+
 
 class PaperContent(BaseModel):
-    """Structured content from the paper."""
+    """Structured content from the paper.
+
+    The full text (often several MB of markdown per paper) is held zlib-compressed and
+    decompressed on access, which keeps large corpora and worker results small.
+    """
 
-    full_text: str
     sections: Dict[str, str] = Field(default_factory=dict, description="Section name to content mapping")
     references: List[str] = Field(default_factory=list, description="List of references")
     figures: List[str] = Field(default_factory=list, description="List of figures")
     tables: List[str] = Field(default_factory=list, description="List of tables")
 
+    _full_text_compressed: bytes = PrivateAttr(default=b"")
+
     class Config:
         arbitrary_types_allowed = True
 
+    def __init__(self, full_text: str, **data):
+        super().__init__(**data)
+        self.full_text = full_text
+
+    @computed_field
+    @property
+    def full_text(self) -> str:
+        """Full text of the paper."""
+        if not self._full_text_compressed:
+            return ""
+        return zlib.decompress(self._full_text_compressed).decode("utf-8")
+
+    @full_text.setter
+    def full_text(self, value: str) -> None:
+        # Level 3 trades a little ratio for much faster compression than the default
+        self._full_text_compressed = zlib.compress(value.encode("utf-8"), 3) if value else b""
+
+    def iter_full_text(self, chunk_size: int = FULL_TEXT_CHUNK_BYTES) -> Iterator[str]:
+        """Yield the full text in pieces of at most chunk_size bytes, decompressing incrementally."""
+        decompressor = zlib.decompressobj()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        data = self._full_text_compressed
+        while data:
+            text = decoder.decode(decompressor.decompress(data, chunk_size))
+            data = decompressor.unconsumed_tail
+            if text:
+                yield text
+        text = decoder.decode(decompressor.flush(), final=True)
+        if text:
+            yield text
+
 
 class AcademicPaper(BaseModel):
     """Complete data model for an academic paper."""
@@ -81,7 +164,14 @@ class AcademicPaper(BaseModel):
         """
         Get all searchable text from the paper for similarity matching.
         Combines title, abstract, keywords, and full text.
+
+        Deprecated: similarity is scored on the per-field texts from get_field_texts.
         """
+        warnings.warn(
+            "AcademicPaper.get_searchable_text is deprecated, use get_field_texts instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         parts = []
 
         # Title (weighted more by including it multiple times)
@@ -102,6 +192,21 @@ class AcademicPaper(BaseModel):
 
         return " ".join(parts)
 
+    def get_field_texts(self, max_body_chars: int = 4000) -> Dict[str, str]:
+        """
+        Get the texts of the fields that are embedded separately for similarity matching.
+
+        Returns:
+            Mapping of field name (title, abstract, keywords, body) to its text, empty if missing;
+            the body is the beginning of the full text
+        """
+        return {
+            "title": self.paper_metadata.title or "",
+            "abstract": self.paper_metadata.abstract or "",
+            "keywords": ", ".join(self.paper_metadata.keywords),
+            "body": self.content.full_text[:max_body_chars],
+        }
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization with custom formatting."""
         # Use Pydantic's model_dump() method but customize Path and datetime serialization
@@ -117,3 +222,55 @@ class AcademicPaper(BaseModel):
             result["parse_timestamp"] = result["parse_timestamp"].isoformat()
 
         return result
+
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize to UTF-8 JSON, with the same content as ``to_dict``.
+
+        Serialization runs in native code (orjson when installed, pydantic-core otherwise)
+        without the Python-level datetime and Path conversion of ``to_dict``.
+
+        Args:
+            indent: Pretty-print with two-space indentation
+        """
+        if orjson is None:
+            return self.__pydantic_serializer__.to_json(self, indent=2 if indent else None)
+        return orjson.dumps(self.model_dump(), default=str, option=orjson.OPT_INDENT_2 if indent else None)
+
+    def write_json(self, fp: BinaryIO, indent: bool = False) -> None:
+        """
+        Write the same JSON as ``to_json_bytes`` to a binary file, one field at a time.
+
+        The full text is decompressed and escaped in chunks straight into ``fp``, so neither
+        the serialized document nor the decompressed full text is held in memory at once.
+
+        Args:
+            fp: Binary file object to write to
+            indent: Pretty-print with two-space indentation
+        """
+        separator = b": " if indent else b":"
+
+        def write_member(index: int, name: str, value: Any, newline: bytes) -> None:
+            # Nested values are indented one level deeper than the member's own line
+            value_json = _dump_json(value, indent).replace(b"\n", newline) if indent else _dump_json(value)
+            fp.write((b"," if index else b"") + newline + _dump_json(name) + separator + value_json)
+
+        newline = b"\n  " if indent else b""
+        content_newline = b"\n    " if indent else b""
+        fields = self.model_dump(exclude={"content"})
+        fp.write(b"{")
+        for index, name in enumerate(type(self).model_fields):
+            if name != "content":
+                write_member(index, name, fields[name], newline)
+                continue
+
+            # Content, with the full text streamed last
+            fp.write((b"," if index else b"") + newline + b'"content"' + separator + b"{")
+            content_fields = self.content.model_dump(exclude={"full_text"})
+            for content_index, (content_name, value) in enumerate(content_fields.items()):
+                write_member(content_index, content_name, value, content_newline)
+            fp.write((b"," if content_fields else b"") + content_newline + b'"full_text"' + separator + b'"')
+            for chunk in self.content.iter_full_text(FULL_TEXT_CHUNK_BYTES):
+                fp.write(_dump_json(chunk)[1:-1])
+            fp.write(b'"' + newline + b"}")
+        fp.write((b"\n" if indent else b"") + b"}")
@@ -9,5 +9,8 @@ class PaperOcrBase(ABC):
     """Base class for paper parsing."""
 
     @abstractmethod
-    def parse_file(self, file_path: Path) -> Optional[AcademicPaper]:
-        """Parse the file and return the AcademicPaper."""
+    def parse_file(self, file_path: Path, content_hash: Optional[str] = None) -> Optional[AcademicPaper]:
+        """Parse the file and return the AcademicPaper.
+
+        ``content_hash`` may be passed when the caller has already hashed the file.
+        """
@@ -1,58 +1,147 @@
-import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from cogents_core.llm import BaseLLMClient
 from cogents_core.utils import get_logger
+from pydantic import ValidationError
 
-from alithia.paperlens.models import AcademicPaper, FileMetadata, PaperContent, PaperMetadata
+from alithia.paperlens.models import AcademicPaper, FileMetadata, PaperContent, PaperMetadata, normalize_doi
 from alithia.paperlens.paper_ocr.base import PaperOcrBase
+from alithia.paperlens.paper_ocr.extraction_cache import ExtractionCache
+from alithia.utils.file_utils import compute_bytes_hash
+
+if TYPE_CHECKING:
+    # Importing cogents_core.llm pulls in litellm, which takes seconds; only needed for typing
+    from cogents_core.llm import BaseLLMClient
 
 logger = get_logger(__name__)
 
+# Bump when the extraction pipeline or the LLM metadata prompt changes, to invalidate cached results
+EXTRACTION_VERSION = "2"
 
-class DoclingOcr(PaperOcrBase):
-    """PDF parser using Docling with IBM Granite VLM."""
+# Docling conversion pipeline: text layer via the pypdfium backend, no OCR
+PIPELINE = "pypdfium-text"
+
+# Number of paper characters sent to the LLM for metadata extraction
+LLM_MAX_CHARS = 4000
+
+# Maximum number of concurrent LLM metadata requests
+LLM_WORKERS = 8
+
+# LLM metadata requests per paper, and base delay in seconds between them, when a request
+# fails (transient API errors are retried as well as responses that fail schema validation)
+LLM_ATTEMPTS = 3
+LLM_RETRY_DELAY = 1.0
+
+
+@lru_cache(maxsize=1)
+def _docling_version() -> str:
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _find_validation_error(error: BaseException) -> Optional[ValidationError]:
+    """Return the pydantic ValidationError behind an exception, if any.
 
-    def __init__(self, llm: Optional[BaseLLMClient] = None):
+    Structured-output libraries such as instructor wrap validation failures in their own
+    retry exceptions, so the cause chain is searched as well.
+    """
+    while error is not None:
+        if isinstance(error, ValidationError):
+            return error
+        error = error.__cause__ or error.__context__
+    return None
+
+
+@lru_cache(maxsize=4)
+def _get_converter(pipeline: str = PIPELINE):
+    """Build a docling converter for a pipeline, once per process."""
+    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+
+    if pipeline != "pypdfium-text":
+        raise ValueError(f"Unknown docling pipeline: {pipeline}")
+
+    # Only the text is needed for semantic matching, so skip OCR and table structure
+    # recognition and use the lightweight pypdfium backend instead of docling-parse.
+    pipeline_options = PdfPipelineOptions(do_ocr=False, do_table_structure=False)
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_options=pipeline_options,
+                backend=PyPdfiumDocumentBackend,
+            )
+        }
+    )
+
+
+class DoclingOcr(PaperOcrBase):
+    """PDF parser using Docling's text-layer pipeline (pypdfium backend, no OCR)."""
+
+    def __init__(
+        self,
+        llm: Optional["BaseLLMClient"] = None,
+        page_batch_size: int = 50,
+        extraction_cache: Optional[ExtractionCache] = None,
+    ):
+        """
+        Args:
+            llm: Optional LLM client for metadata enhancement
+            page_batch_size: Convert long PDFs this many pages at a time to bound peak memory
+            extraction_cache: Optional cache of parse results keyed by PDF content and settings
+        """
         super().__init__()
         self.llm = llm
+        self.page_batch_size = page_batch_size
+        self.extraction_cache = extraction_cache
         if self.llm is None:
             logger.warning("No LLM - metadata extraction limited")
 
-        try:
-            from docling.datamodel.base_models import InputFormat
-            from docling.datamodel.pipeline_options import VlmPipelineOptions
-            from docling.document_converter import DocumentConverter, PdfFormatOption
-            from docling.pipeline.vlm_pipeline import VlmPipeline
-
-            # Use IBM Granite Docling 258M - a multimodal model specifically designed for document conversion
-            # See: https://huggingface.co/ibm-granite/granite-docling-258M
-            pipeline_options = VlmPipelineOptions()
-            self.converter = DocumentConverter(
-                format_options={
-                    InputFormat.PDF: PdfFormatOption(
-                        pipeline_cls=VlmPipeline,
-                        pipeline_options=pipeline_options,
-                    )
-                }
-            )
-        except (ImportError, TypeError, AttributeError) as e:
-            logger.warning(f"IBM Granite Docling VLM unavailable ({e}), using default")
-            from docling.document_converter import DocumentConverter
-
-            self.converter = DocumentConverter()
+    @cached_property
+    def converter(self):
+        """Docling converter, shared with other instances in this process and built on first use."""
+        return _get_converter(PIPELINE)
 
-    def parse_file(self, file_path: Path) -> Optional[AcademicPaper]:
+    def parse_file(self, file_path: Path, content_hash: Optional[str] = None) -> Optional[AcademicPaper]:
         """Parse PDF and extract structured content.
 
         Args:
             pdf_path: Path to PDF file
+            content_hash: Precomputed content hash of the file (computed if omitted)
 
         Returns:
             AcademicPaper or None if parsing fails
         """
+        paper, needs_llm = self.parse_file_without_llm(file_path, content_hash=content_hash)
+        if needs_llm:
+            self.enhance_metadata_with_llm([paper])
+        return paper
+
+    def parse_file_without_llm(
+        self, file_path: Path, content_hash: Optional[str] = None
+    ) -> Tuple[Optional[AcademicPaper], bool]:
+        """Parse PDF with docling only, deferring LLM metadata enhancement.
+
+        Papers that still need the LLM are not cached yet; pass them (batched across
+        files) to enhance_metadata_with_llm, which also caches them.
+
+        Args:
+            pdf_path: Path to PDF file
+            content_hash: Precomputed content hash of the file (computed if omitted)
+
+        Returns:
+            Tuple of the AcademicPaper (or None if parsing fails) and whether it still
+            needs LLM metadata enhancement
+        """
         logger.info(f"Parsing {file_path.name}")
         errors = []
         parse_timestamp = datetime.now()
@@ -60,44 +149,46 @@ class DoclingOcr(PaperOcrBase):
         try:
             # Compute file metadata
             stat = file_path.stat()
-            with open(file_path, "rb") as f:
-                md5_hash = hashlib.md5(f.read()).hexdigest()
+            pdf_bytes = None
+            if content_hash is None:
+                pdf_bytes = file_path.read_bytes()
+                content_hash = compute_bytes_hash(pdf_bytes)
 
             file_metadata = FileMetadata(
                 file_path=file_path,
                 file_name=file_path.name,
                 file_size=stat.st_size,
                 last_modified=datetime.fromtimestamp(stat.st_mtime),
-                md5_hash=md5_hash,
+                content_hash=content_hash,
             )
 
-            # Convert PDF with docling
+            if self.extraction_cache:
+                cached_paper = self.extraction_cache.get(self._cache_key(content_hash))
+                if cached_paper:
+                    logger.info(f"Using cached extraction for {file_path.name}")
+                    return cached_paper.model_copy(update={"file_metadata": file_metadata}), False
+
+            # Read the PDF once; page counting and every docling batch work on the in-memory bytes
+            if pdf_bytes is None:
+                pdf_bytes = file_path.read_bytes()
+
+            # Convert PDF with docling, in page batches for long documents
             try:
-                doc = self.converter.convert(str(file_path)).document
+                page_texts = []
+                paper_metadata = None
+                for doc in self._convert_in_batches(file_path.name, pdf_bytes):
+                    if paper_metadata is None:
+                        # Title, authors and abstract live on the first pages
+                        paper_metadata = self._extract_metadata(doc)
+                    page_texts.append(self._extract_text(doc))
+                    del doc
             except Exception as e:
                 error_msg = f"Docling conversion failed: {str(e)}"
                 logger.error(error_msg)
                 errors.append(error_msg)
-                return None
+                return None, False
 
-            # Extract content and metadata
-            content = self._extract_content(doc)
-            paper_metadata = self._extract_metadata(doc)
-
-            # LLM fallback for incomplete metadata
-            if self._is_metadata_incomplete(paper_metadata):
-                if self.llm is not None:
-                    logger.info("Enhancing metadata with LLM")
-                    try:
-                        llm_metadata = self._extract_metadata_with_llm(content.full_text)
-                        paper_metadata = self._merge_metadata(paper_metadata, llm_metadata)
-                        logger.info("Metadata enhanced")
-                    except Exception as e:
-                        error_msg = f"LLM extraction failed: {str(e)}"
-                        logger.warning(error_msg)
-                        errors.append(error_msg)
-                else:
-                    logger.warning("Metadata incomplete and no LLM available for metadata enhancement")
+            content = PaperContent(full_text="\n\n".join(text for text in page_texts if text))
 
             paper = AcademicPaper(
                 file_metadata=file_metadata,
@@ -106,12 +197,60 @@ class DoclingOcr(PaperOcrBase):
                 parse_timestamp=parse_timestamp,
                 parsing_errors=errors,
             )
-            return paper
+
+            # LLM fallback for incomplete metadata
+            if self._is_metadata_incomplete(paper_metadata):
+                if self.llm is not None:
+                    return paper, True
+                logger.warning("Metadata incomplete and no LLM available for metadata enhancement")
+
+            self._cache_paper(paper)
+            return paper, False
         except Exception as e:
             error_msg = f"Parse error: {str(e)}"
             logger.error(error_msg)
             errors.append(error_msg)
-            return None
+            return None, False
+
+    def enhance_metadata_with_llm(self, papers: List[AcademicPaper], max_workers: int = LLM_WORKERS) -> None:
+        """Fill in incomplete metadata of parsed papers with the LLM, in place.
+
+        LLM calls are network bound, so they are issued concurrently from a thread pool
+        instead of one round trip after another. Enhanced papers are cached.
+
+        Args:
+            papers: Papers returned by parse_file_without_llm as needing enhancement
+            max_workers: Maximum number of concurrent LLM requests
+        """
+        if not papers:
+            return
+
+        if len(papers) > 1:
+            logger.info(f"Enhancing metadata of {len(papers)} papers with LLM")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(papers)))) as executor:
+            futures = [executor.submit(self._extract_metadata_with_llm, paper.content.full_text) for paper in papers]
+
+            for paper, future in zip(papers, futures):
+                try:
+                    llm_metadata = future.result()
+                    paper.paper_metadata = self._merge_metadata(paper.paper_metadata, llm_metadata)
+                    logger.info(f"Metadata of {paper.file_metadata.file_name} enhanced")
+                except Exception as e:
+                    error_msg = f"LLM extraction failed: {str(e)}"
+                    logger.warning(error_msg)
+                    paper.parsing_errors.append(error_msg)
+
+                self._cache_paper(paper)
+
+    def _cache_paper(self, paper: AcademicPaper) -> None:
+        """Store a parse result in the extraction cache."""
+        # Only cache complete results so failed LLM calls are retried next time
+        if not self.extraction_cache or paper.parsing_errors:
+            return
+        try:
+            self.extraction_cache.put(self._cache_key(paper.file_metadata.content_hash), paper)
+        except Exception as e:
+            logger.warning(f"Failed to cache extraction of {paper.file_metadata.file_name}: {e}")
 
     def _extract_metadata(self, doc) -> PaperMetadata:
         """Extract metadata from docling document."""
@@ -134,29 +273,73 @@ class DoclingOcr(PaperOcrBase):
                 metadata.abstract = doc.abstract.strip()
 
             if hasattr(doc, "doi") and doc.doi:
-                metadata.doi = doc.doi.strip()
+                metadata.doi = normalize_doi(doc.doi)
 
         except Exception as e:
             logger.warning(f"Metadata extraction error: {e}")
 
         return metadata
 
-    def _extract_content(self, doc) -> PaperContent:
-        """Extract full text content from docling document."""
-        content = PaperContent(full_text="")
+    def _cache_key(self, content_hash: str) -> dict:
+        """Build the extraction cache key: file content plus everything that shapes the result."""
+        llm_model = None
+        if self.llm is not None:
+            llm_model = f"{type(self.llm).__name__}:{getattr(self.llm, 'chat_model', '')}"
+
+        return {
+            "content_hash": content_hash,
+            "docling": _docling_version(),
+            "pipeline": PIPELINE,
+            "llm": llm_model,
+            "version": EXTRACTION_VERSION,
+        }
+
+    def _convert_in_batches(self, name: str, pdf_bytes: bytes):
+        """Yield docling documents for consecutive page ranges of the PDF.
+
+        Only one batch of converted pages is held in memory at a time. PDFs with at most
+        ``page_batch_size`` pages (or an unknown page count) are converted in one go.
+        """
+        from docling.datamodel.base_models import DocumentStream
+
+        page_count = self._get_page_count(pdf_bytes)
+        if page_count is None or page_count <= self.page_batch_size:
+            yield self.converter.convert(DocumentStream(name=name, stream=BytesIO(pdf_bytes))).document
+            return
+
+        for start in range(1, page_count + 1, self.page_batch_size):
+            end = min(start + self.page_batch_size - 1, page_count)
+            source = DocumentStream(name=name, stream=BytesIO(pdf_bytes))
+            yield self.converter.convert(source, page_range=(start, end)).document
 
+    @staticmethod
+    def _get_page_count(pdf_bytes: bytes) -> Optional[int]:
+        """Get the number of pages of a PDF, or None if it cannot be read."""
+        try:
+            import pypdfium2
+
+            pdf = pypdfium2.PdfDocument(pdf_bytes)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.debug(f"Could not count PDF pages: {e}")
+            return None
+
+    def _extract_text(self, doc) -> str:
+        """Extract full text content from docling document."""
         try:
             if hasattr(doc, "export_to_markdown"):
-                content.full_text = doc.export_to_markdown()
+                return doc.export_to_markdown()
             elif hasattr(doc, "export_to_text"):
-                content.full_text = doc.export_to_text()
+                return doc.export_to_text()
             else:
-                content.full_text = str(doc)
+                return str(doc)
 
         except Exception as e:
             logger.warning(f"Content extraction error: {e}")
-
-        return content
+            return ""
 
     def _is_metadata_incomplete(self, metadata: PaperMetadata) -> bool:
         """Check if metadata needs LLM enhancement.
@@ -178,7 +361,8 @@ class DoclingOcr(PaperOcrBase):
         Returns:
             PaperMetadata extracted by LLM
         """
-        truncated_text = full_text[:8000] if len(full_text) > 8000 else full_text
+        # Title, authors and abstract are at the start of the paper
+        truncated_text = full_text[:LLM_MAX_CHARS]
         prompt = f"""Extract the following metadata from this academic paper:
 
 Paper text:
@@ -197,11 +381,25 @@ If any field is not found or unclear, leave it empty."""
 
         messages = [{"role": "user", "content": prompt}]
 
-        llm_response = self.llm.structured_completion(
-            messages=messages, response_model=PaperMetadata, temperature=0.1, max_tokens=1000
-        )
-
-        return llm_response
+        # Retries are handled here rather than by the client, so that a malformed answer is
+        # re-prompted with its validation error instead of being blindly repeated
+        for attempt in range(LLM_ATTEMPTS):
+            try:
+                return self.llm.structured_completion(
+                    messages=messages, response_model=PaperMetadata, temperature=0.1, max_tokens=1000, attempts=1
+                )
+            except Exception as e:
+                if attempt == LLM_ATTEMPTS - 1:
+                    raise
+                validation_error = _find_validation_error(e)
+                if validation_error is None:
+                    logger.debug(f"LLM metadata request failed (attempt {attempt + 1}): {e}")
+                else:
+                    logger.debug(f"LLM metadata failed validation (attempt {attempt + 1}): {validation_error}")
+                    messages = messages + [
+                        {"role": "user", "content": f"Your output had error: {validation_error}. Fix and retry."}
+                    ]
+                time.sleep(LLM_RETRY_DELAY * (attempt + 1))
 
     def _merge_metadata(self, docling_metadata: PaperMetadata, llm_metadata: PaperMetadata) -> PaperMetadata:
         """Merge docling and LLM metadata (docling takes precedence).
@@ -0,0 +1,89 @@
+"""
+Content-addressable cache of parsed papers.
+
+Each entry is a JSON file named after a digest of the extraction key (PDF content
+hash plus everything that influences the result: docling version, pipeline, LLM
+model and prompt version), so re-running PaperLens over the same PDFs skips both
+docling conversion and LLM metadata extraction.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from cogents_core.utils import get_logger
+
+from alithia.constants import DEFAULT_PAPERLENS_CACHE_DIR
+from alithia.paperlens.models import AcademicPaper
+
+logger = get_logger(__name__)
+
+
+class ExtractionCache:
+    """On-disk JSON cache of AcademicPaper extraction results."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the extraction cache.
+
+        Args:
+            cache_dir: Base cache directory; entries go to its ``extractions`` subdirectory
+                       (defaults to DEFAULT_PAPERLENS_CACHE_DIR)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_PAPERLENS_CACHE_DIR).expanduser() / "extractions"
+
+    def _entry_path(self, key: Dict[str, Any]) -> Path:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key: Dict[str, Any]) -> Optional[AcademicPaper]:
+        """
+        Look up a cached extraction.
+
+        Args:
+            key: Extraction key (content hash and extraction settings)
+
+        Returns:
+            Cached AcademicPaper, or None on a miss or unreadable entry
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return AcademicPaper.model_validate(entry["paper"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable extraction cache entry {path.name}: {e}")
+            return None
+
+    def put(self, key: Dict[str, Any], paper: AcademicPaper) -> None:
+        """
+        Store an extraction result.
+
+        Args:
+            key: Extraction key (content hash and extraction settings)
+            paper: Parsed paper to cache
+        """
+        path = self._entry_path(key)
+        # Splice the natively serialized paper into the entry instead of round-tripping it through a dict
+        entry = b'{"key": %s, "cached_at": %s, "paper": %s}' % (
+            json.dumps(key).encode("utf-8"),
+            json.dumps(datetime.now(timezone.utc).isoformat()).encode("utf-8"),
+            paper.to_json_bytes(),
+        )
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so concurrent workers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(entry)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
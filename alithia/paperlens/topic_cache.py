@@ -0,0 +1,132 @@
+"""
+Semantic cache of research-topic results for PaperLens.
+
+Maps a research topic embedding to the similarity scores it produced over a
+given corpus. A new topic whose embedding is close enough to a cached one
+(cosine >= threshold) reuses those scores instead of recomputing them, so
+near-duplicate queries against an unchanged corpus return immediately.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from alithia.constants import DEFAULT_PAPERLENS_CACHE_DIR
+
+
+class TopicCache:
+    """SQLite-backed semantic cache with LRU eviction."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, threshold: float = 0.87, max_entries: int = 256):
+        """
+        Initialize the topic cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+                       (defaults to DEFAULT_PAPERLENS_CACHE_DIR)
+            threshold: Minimum cosine similarity between topics for a cache hit
+            max_entries: Maximum number of cached topics before the least recently used are evicted
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_PAPERLENS_CACHE_DIR).expanduser()
+        self.db_path = self.cache_dir / "topics.sqlite"
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self.conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS topic_scores (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    model TEXT NOT NULL,
+                    corpus TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    scores BLOB NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_topic_scores_corpus ON topic_scores(model, corpus)")
+        return self.conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, model: str, corpus: str, topic_embedding: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Find cached scores for a semantically equivalent topic.
+
+        Args:
+            model: Embedding model name
+            corpus: Fingerprint of the corpus the scores were computed over
+            topic_embedding: Embedding of the research topic
+
+        Returns:
+            Cached scores of the nearest topic if it is within the threshold, otherwise None
+        """
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT id, vector, scores FROM topic_scores WHERE model = ? AND corpus = ?",
+            (model, corpus),
+        ).fetchall()
+        if not rows:
+            return None
+
+        # Brute-force nearest neighbour; the number of cached topics per corpus is small
+        vectors = np.stack([np.frombuffer(vector, dtype=np.float32) for _, vector, _ in rows])
+        similarities = vectors @ self._normalize(topic_embedding)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        row_id, _, scores = rows[best]
+        with conn:
+            conn.execute("UPDATE topic_scores SET last_used = ? WHERE id = ?", (time.time(), row_id))
+        return np.frombuffer(scores, dtype=np.float32)
+
+    def store(self, model: str, corpus: str, topic_embedding: np.ndarray, scores: np.ndarray) -> None:
+        """
+        Cache the scores computed for a topic.
+
+        Args:
+            model: Embedding model name
+            corpus: Fingerprint of the corpus the scores were computed over
+            topic_embedding: Embedding of the research topic
+            scores: Similarity scores, in the corpus fingerprint's paper order
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO topic_scores (model, corpus, vector, scores, last_used) VALUES (?, ?, ?, ?, ?)",
+                (
+                    model,
+                    corpus,
+                    self._normalize(topic_embedding).tobytes(),
+                    np.asarray(scores, dtype=np.float32).tobytes(),
+                    time.time(),
+                ),
+            )
+            conn.execute(
+                """
+                DELETE FROM topic_scores WHERE id NOT IN (
+                    SELECT id FROM topic_scores ORDER BY last_used DESC, id DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
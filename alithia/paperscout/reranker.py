@@ -2,16 +2,202 @@
 Paper recommendation and reranking utilities.
 """
 
+import importlib.util
 import logging
-from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
 from .models import ArxivPaper, ScoredPaper
+from .score_cache import RerankScoreCache
 
 logger = logging.getLogger(__name__)
 
+# Number of (query, passage) pairs scored per cross-encoder forward pass
+FLASHRANK_BATCH_SIZE = 256
+
+# Directory where FlashRank downloads its models
+FLASHRANK_CACHE_DIR = "/tmp/flashrank_cache"
+
+
+@lru_cache(maxsize=4)
+def get_flashrank_ranker(model_name: str, cache_dir: str = FLASHRANK_CACHE_DIR):
+    """
+    Get a FlashRank ranker, loading each model (and its ONNX session) once per process.
+
+    Args:
+        model_name: FlashRank model name
+        cache_dir: Directory where the model is downloaded
+
+    Returns:
+        flashrank.Ranker for the model
+    """
+    from flashrank import Ranker
+
+    logger.info(f"Loading FlashRank model: {model_name}")
+    return Ranker(model_name=model_name, cache_dir=cache_dir)
+
+
+@lru_cache(maxsize=16)
+def time_decay_weights(n: int) -> np.ndarray:
+    """
+    Get normalized time decay weights 1 / (1 + log10(rank)) for a corpus of n items.
+
+    The result is cached and read-only; copy it before modifying.
+
+    Args:
+        n: Number of corpus items, ordered newest first
+
+    Returns:
+        Weights summing to 1, one per corpus position
+    """
+    weights = 1 / (1 + np.log10(np.arange(n) + 1))
+    weights /= weights.sum()
+    weights.flags.writeable = False
+    return weights
+
+
+def flashrank_pair_scores(
+    ranker,
+    pairs: List[List[str]],
+    batch_size: int = FLASHRANK_BATCH_SIZE,
+    score_cache: Optional[RerankScoreCache] = None,
+    model_name: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Score (query, passage) pairs with a FlashRank cross-encoder.
+
+    Unlike ``Ranker.rerank``, which handles one query per call, all pairs are
+    tokenized with ``encode_batch`` (which tokenizes in parallel) and run through
+    the ONNX session in a few large, length-sorted batches. Duplicate pairs are
+    scored once, and with a score cache only pairs missing from it are scored.
+
+    Args:
+        ranker: Pairwise (ONNX) flashrank.Ranker
+        pairs: [query, passage] text pairs
+        batch_size: Number of pairs per forward pass
+        score_cache: Optional persistent cache of pair scores
+        model_name: Name of the ranker's model, required with score_cache
+
+    Returns:
+        Relevance scores in [0, 1], one per pair
+
+    Raises:
+        ValueError: If the ranker is a listwise (LLM) model, which produces no scores
+    """
+    if getattr(ranker, "llm_model", None) is not None:
+        raise ValueError("Listwise FlashRank models do not produce pairwise scores")
+
+    # Score repeated pairs (e.g. duplicate summaries or corpus abstracts) once
+    unique_pairs = {tuple(pair): None for pair in pairs}
+    if len(unique_pairs) < len(pairs):
+        unique_scores = flashrank_pair_scores(
+            ranker, [list(pair) for pair in unique_pairs], batch_size, score_cache=score_cache, model_name=model_name
+        )
+        index = {pair: i for i, pair in enumerate(unique_pairs)}
+        return unique_scores[[index[tuple(pair)] for pair in pairs]]
+
+    if score_cache is not None:
+        if model_name is None:
+            raise ValueError("model_name is required when using a score cache")
+        keys = [RerankScoreCache.pair_key(query, passage) for query, passage in pairs]
+        cached = score_cache.get_many(model_name, keys)
+        scores = np.array([cached.get(key, np.nan) for key in keys], dtype=np.float32)
+        misses = np.flatnonzero(np.isnan(scores))
+        if len(misses):
+            logger.debug(f"Scoring {len(misses)} of {len(pairs)} pairs not found in the score cache")
+            scores[misses] = flashrank_pair_scores(ranker, [pairs[i] for i in misses], batch_size)
+            score_cache.put_many(model_name, {keys[i]: scores[i] for i in misses})
+        return scores
+
+    scores = np.empty(len(pairs), dtype=np.float32)
+
+    # Batch pairs of similar length together so each batch is padded to a length close to its
+    # own texts rather than to the longest pair overall
+    order = np.argsort([len(query) + len(passage) for query, passage in pairs], kind="stable")
+    # Send token_type_ids only to models that declare the input (BERT-style cross-encoders)
+    use_token_type_ids = "token_type_ids" in {i.name for i in ranker.session.get_inputs()}
+
+    for start in range(0, len(pairs), batch_size):
+        batch = order[start : start + batch_size]
+        encodings = ranker.tokenizer.encode_batch([pairs[i] for i in batch])
+        onnx_input = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+        }
+        if use_token_type_ids:
+            onnx_input["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        logits = ranker.session.run(None, onnx_input)[0]
+        # Same logits-to-score mapping as Ranker.rerank
+        if logits.shape[1] == 1:
+            batch_scores = 1 / (1 + np.exp(-logits[:, 0]))
+        else:
+            exp_logits = np.exp(logits)
+            batch_scores = exp_logits[:, 1] / exp_logits.sum(axis=1)
+        scores[batch] = batch_scores
+
+    return scores
+
+
+def flashrank_score_matrix(
+    ranker,
+    queries: List[str],
+    passages: List[str],
+    batch_size: int = FLASHRANK_BATCH_SIZE,
+    score_cache: Optional[RerankScoreCache] = None,
+    model_name: Optional[str] = None,
+) -> np.ndarray:
+    """
+    Score every (query, passage) pair with a FlashRank cross-encoder.
+
+    Args:
+        ranker: Pairwise (ONNX) flashrank.Ranker
+        queries: Query texts
+        passages: Passage texts
+        batch_size: Number of pairs per forward pass
+        score_cache: Optional persistent cache of pair scores
+        model_name: Name of the ranker's model, required with score_cache
+
+    Returns:
+        Relevance scores in [0, 1], shape (len(queries), len(passages))
+    """
+    pairs = [[query, passage] for query in queries for passage in passages]
+    scores = flashrank_pair_scores(ranker, pairs, batch_size, score_cache=score_cache, model_name=model_name)
+    return scores.reshape(len(queries), len(passages))
+
+
+def lexical_top_k(queries: List[str], passages: List[str], top_k: int) -> np.ndarray:
+    """
+    Select the ``top_k`` passages most similar to each query by TF-IDF cosine similarity.
+
+    Serves as a cheap first stage that limits which pairs reach the cross-encoder.
+
+    Args:
+        queries: Query texts
+        passages: Passage texts
+        top_k: Number of passages to keep per query
+
+    Returns:
+        Passage indices, shape (len(queries), min(top_k, len(passages))), in no particular order
+
+    Raises:
+        ValueError: If top_k is less than 1, or if the passages contain no terms
+                    (empty or stop words only), which leaves TF-IDF an empty vocabulary
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    if top_k < 1:
+        raise ValueError(f"top_k must be at least 1, got {top_k}")
+
+    top_k = min(top_k, len(passages))
+    vectorizer = TfidfVectorizer(stop_words="english")
+    passage_vectors = vectorizer.fit_transform(passages)
+    # TF-IDF rows are L2-normalized, so the dot product is the cosine similarity
+    similarity = (vectorizer.transform(queries) @ passage_vectors.T).toarray()
+    return np.argpartition(-similarity, top_k - 1, axis=1)[:, :top_k]
+
 
 class PaperReranker:
     """
@@ -46,7 +232,27 @@ class PaperReranker:
         if not self.corpus:
             logger.warning("Empty corpus provided for reranking")
 
-    def rerank_flashrank(self, model_name: str = "ms-marco-MiniLM-L-12-v2") -> List[ScoredPaper]:
+    @cached_property
+    def sorted_corpus(self) -> List[Dict[str, Any]]:
+        """Corpus items that have a dateAdded, sorted newest first (computed once per reranker)."""
+        sorted_corpus = []
+        for item in self.corpus:
+            try:
+                if item.get("data", {}).get("dateAdded", ""):
+                    sorted_corpus.append(item)
+            except Exception as e:
+                logger.warning(f"Error processing corpus item: {e}")
+
+        # Zotero dateAdded is fixed-width ISO-8601 UTC ("%Y-%m-%dT%H:%M:%SZ"), so it sorts correctly as a string
+        sorted_corpus.sort(key=lambda x: x["data"]["dateAdded"], reverse=True)
+        return sorted_corpus
+
+    def rerank_flashrank(
+        self,
+        model_name: str = "ms-marco-MiniLM-L-12-v2",
+        top_k: Optional[int] = None,
+        score_cache: Optional[RerankScoreCache] = None,
+    ) -> List[ScoredPaper]:
         """
         Rerank papers based on relevance to user's research corpus.
 
@@ -54,63 +260,70 @@ class PaperReranker:
             papers: List of papers to score
             corpus: User's Zotero corpus for comparison
             model_name: FlashRank model to use (default: ms-marco-MiniLM-L-12-v2)
+            top_k: If set, score each paper only against its top_k lexically most similar
+                   corpus abstracts (time decay weights renormalized over those), instead of
+                   the whole corpus
+            score_cache: Optional persistent cache of (paper, corpus abstract) scores, so
+                         only pairs not seen before are sent to the cross-encoder
 
         Returns:
             List of scored papers sorted by relevance
+
+        Raises:
+            ValueError: If top_k is less than 1
         """
-        try:
-            from flashrank import Ranker, RerankRequest
-        except ImportError:
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}")
+        if importlib.util.find_spec("flashrank") is None:
             raise ImportError("FlashRank is not installed. Please install it using `pip install flashrank`.")
 
-        if not self.papers or not self.corpus:
+        # Corpus sorted by date (newest first)
+        sorted_corpus = self.sorted_corpus
+        if not self.papers or not sorted_corpus:
             return [ScoredPaper(paper=paper, score=0.0) for paper in self.papers]
 
-        # Initialize FlashRank ranker
-        ranker = Ranker(model_name=model_name, cache_dir="/tmp/flashrank_cache")
+        # FlashRank ranker, shared across calls
+        ranker = get_flashrank_ranker(model_name)
 
-        # Sort corpus by date (newest first)
-        sorted_corpus = sorted(
-            self.corpus, key=lambda x: datetime.strptime(x["data"]["dateAdded"], "%Y-%m-%dT%H:%M:%SZ"), reverse=True
-        )
+        # Time decay weights, shared across calls
+        time_decay_weight = time_decay_weights(len(sorted_corpus))
 
-        # Calculate time decay weights
-        time_decay_weight = 1 / (1 + np.log10(np.arange(len(sorted_corpus)) + 1))
-        time_decay_weight = time_decay_weight / time_decay_weight.sum()
+        queries = [paper.summary for paper in self.papers]
+        passages = [paper["data"]["abstractNote"] for paper in sorted_corpus]
 
-        # Prepare corpus abstracts as passages
-        corpus_passages = [{"text": paper["data"]["abstractNote"]} for paper in sorted_corpus]
+        selected = None
+        if top_k is not None and top_k < len(passages):
+            try:
+                # Only send each paper's lexically closest corpus abstracts to the cross-encoder
+                selected = lexical_top_k(queries, passages, top_k)
+            except ValueError as e:
+                logger.warning(f"Lexical preselection failed, scoring against the whole corpus: {e}")
 
-        # Score each paper against the entire corpus
-        scored_papers = []
-        for paper in self.papers:
-            # Create rerank request for this paper against all corpus passages
-            rerank_request = RerankRequest(query=paper.summary, passages=corpus_passages)
-
-            # Get reranking results
-            results = ranker.rerank(rerank_request)
-
-            # Create a mapping from text to corpus index
-            text_to_idx = {paper["data"]["abstractNote"]: idx for idx, paper in enumerate(sorted_corpus)}
+        if selected is None:
+            # Score all papers against all corpus abstracts in batched forward passes
+            relevance = flashrank_score_matrix(
+                ranker, queries, passages, score_cache=score_cache, model_name=model_name
+            )
 
-            # Calculate weighted score based on corpus relevance and time decay
-            weighted_scores = []
-            for result in results:
-                relevance_score = result["score"]
-                # Find which corpus paper this result corresponds to
-                idx = text_to_idx[result["text"]]
-                weighted_score = relevance_score * time_decay_weight[idx]
-                weighted_scores.append(weighted_score)
+            # Weight corpus relevance by time decay, sum and scale
+            final_scores = relevance @ time_decay_weight * 10
+        else:
+            pairs = [[queries[i], passages[j]] for i, row in enumerate(selected) for j in row]
+            relevance = flashrank_pair_scores(ranker, pairs, score_cache=score_cache, model_name=model_name)
+            relevance = relevance.reshape(selected.shape)
 
-            # Sum weighted scores and scale
-            final_score = sum(weighted_scores) * 10
+            # Weight by time decay renormalized over the selected abstracts, sum and scale
+            weights = time_decay_weight[selected]
+            final_scores = (relevance * weights).sum(axis=1) / weights.sum(axis=1) * 10
 
-            scored_paper = ScoredPaper(
+        scored_papers = [
+            ScoredPaper(
                 paper=paper,
                 score=float(final_score),
                 relevance_factors={"corpus_similarity": float(final_score), "corpus_size": len(self.corpus)},
             )
-            scored_papers.append(scored_paper)
+            for paper, final_score in zip(self.papers, final_scores)
+        ]
 
         # Sort by score (highest first)
         scored_papers.sort(key=lambda x: x.score, reverse=True)
@@ -151,20 +364,8 @@ class PaperReranker:
             logger.info(f"Loading sentence transformer model: {model_name}")
             encoder = SentenceTransformer(model_name, cache_folder=self.cache_dir)
 
-            # Sort corpus by date (newest first) with better error handling
-            sorted_corpus = []
-            for item in self.corpus:
-                try:
-                    date_str = item.get("data", {}).get("dateAdded", "")
-                    if date_str:
-                        sorted_corpus.append(item)
-                except Exception as e:
-                    logger.warning(f"Error processing corpus item: {e}")
-                    continue
-
-            sorted_corpus.sort(
-                key=lambda x: datetime.strptime(x["data"]["dateAdded"], "%Y-%m-%dT%H:%M:%SZ"), reverse=True
-            )
+            # Corpus sorted by date (newest first)
+            sorted_corpus = self.sorted_corpus
 
             if not sorted_corpus:
                 logger.warning("No valid corpus items after filtering")
@@ -172,9 +373,8 @@ class PaperReranker:
                     ScoredPaper(paper=paper, score=5.0, relevance_factors={"fallback": 5.0}) for paper in self.papers
                 ]
 
-            # Calculate time decay weights
-            time_decay_weight = 1 / (1 + np.log10(np.arange(len(sorted_corpus)) + 1))
-            time_decay_weight = time_decay_weight / time_decay_weight.sum()
+            # Time decay weights, shared across calls
+            time_decay_weight = time_decay_weights(len(sorted_corpus))
 
             # Extract and validate corpus texts
             corpus_texts = []
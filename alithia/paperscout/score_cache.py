@@ -0,0 +1,103 @@
+"""
+Persistent cache of cross-encoder rerank scores.
+
+Scores are stored in a small SQLite database keyed by (model name, pair hash),
+where the pair hash covers the query and passage texts, so repeated reranking
+over a stable corpus only sends new (query, passage) pairs to the model.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from alithia.constants import DEFAULT_RERANK_CACHE_DIR
+
+
+class RerankScoreCache:
+    """SQLite-backed key-value store of (query, passage) relevance scores."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the score cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+                       (defaults to DEFAULT_RERANK_CACHE_DIR)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_RERANK_CACHE_DIR).expanduser()
+        self.db_path = self.cache_dir / "rerank_scores.sqlite"
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self.conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scores (
+                    model TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    PRIMARY KEY (model, key)
+                )
+                """
+            )
+        return self.conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    @staticmethod
+    def pair_key(query: str, passage: str) -> str:
+        """Cache key of a (query, passage) pair."""
+        return hashlib.blake2b(query.encode("utf-8") + b"\x00" + passage.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_many(self, model: str, keys: Iterable[str]) -> Dict[str, float]:
+        """
+        Look up cached scores.
+
+        Args:
+            model: Reranker model name
+            keys: Pair keys from pair_key
+
+        Returns:
+            Mapping of key to score for the keys found in the cache
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        conn = self._connect()
+        found = {}
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            batch = keys[i : i + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, score FROM scores WHERE model = ? AND key IN ({placeholders})", (model, *batch)
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, model: str, scores: Dict[str, float]) -> None:
+        """
+        Store scores.
+
+        Args:
+            model: Reranker model name
+            scores: Mapping of pair key to score
+        """
+        if not scores:
+            return
+
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO scores (model, key, score) VALUES (?, ?, ?)",
+                [(model, key, float(score)) for key, score in scores.items()],
+            )
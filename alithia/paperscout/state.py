@@ -2,9 +2,11 @@
 Agent state management for the Alithia research agent.
 """
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from operator import add
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, NamedTuple, Optional
 
 from pydantic import BaseModel, Field
 
@@ -39,23 +41,38 @@ class PaperScoutConfig(BaseModel):
     debug: bool = False
 
 
+class ErrorRecord(NamedTuple):
+    """An error log entry; the timestamp is only formatted when the entry is displayed."""
+
+    timestamp_ns: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"{datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()}: {self.message}"
+
+
 def merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
     """Merge two dictionaries, with right overriding left."""
     return {**left, **right}
 
 
-class AgentState(BaseModel):
-    """Centralized state for the research agent workflow."""
+@dataclass(slots=True)
+class AgentState:
+    """Centralized state for the research agent workflow.
+
+    A plain slotted dataclass: the state is internal and mutated on every node, so it
+    skips pydantic validation. Inputs are validated at the boundary by PaperScoutConfig.
+    """
 
     # Agent Config
     config: PaperScoutConfig
 
     # Discovery State
-    discovered_papers: List[ArxivPaper] = Field(default_factory=list)
-    zotero_corpus: List[Dict[str, Any]] = Field(default_factory=list)
+    discovered_papers: List[ArxivPaper] = field(default_factory=list)
+    zotero_corpus: List[Dict[str, Any]] = field(default_factory=list)
 
     # Assessment State
-    scored_papers: List[ScoredPaper] = Field(default_factory=list)
+    scored_papers: List[ScoredPaper] = field(default_factory=list)
 
     # Content State
     email_content: Optional[EmailContent] = None
@@ -63,16 +80,22 @@ class AgentState(BaseModel):
     # System State
     current_step: str = "initializing"
     # Use Annotated with operator.add to accumulate error_log entries across nodes
-    error_log: Annotated[List[str], add] = Field(default_factory=list)
+    error_log: Annotated[List[ErrorRecord], add] = field(default_factory=list)
     # Use custom merge function to accumulate performance_metrics across nodes
-    performance_metrics: Annotated[Dict[str, float], merge_dicts] = Field(default_factory=dict)
+    performance_metrics: Annotated[Dict[str, float], merge_dicts] = field(default_factory=dict)
 
     # Debug State
     debug_mode: bool = False
 
+    def __post_init__(self) -> None:
+        # LangGraph builds the state from its channel values without copying them. Copy the
+        # containers mutated in place below so nodes never modify the graph's stored state.
+        self.error_log = list(self.error_log)
+        self.performance_metrics = dict(self.performance_metrics)
+
     def add_error(self, error: str) -> None:
         """Add an error to the error log."""
-        self.error_log.append(f"{datetime.now().isoformat()}: {error}")
+        self.error_log.append(ErrorRecord(time.time_ns(), error))
 
     def update_metric(self, key: str, value: float) -> None:
         """Update a performance metric."""
@@ -99,6 +99,20 @@ Examples:
         help="Don't search subdirectories for PDFs",
     )
 
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=1024,
+        help="Skip PDFs smaller than this many bytes, which are empty or truncated (default: 1024)",
+    )
+
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=None,
+        help="Skip PDFs larger than this many bytes (default: no limit)",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -109,7 +123,33 @@ Examples:
     parser.add_argument(
         "--force-gpu",
         action="store_true",
-        help="Force GPU usage even if CUDA compatibility issues are detected",
+        help="Warn if no GPU is available (a GPU is used by default when CUDA is available)",
+    )
+
+    parser.add_argument(
+        "--force-cpu",
+        action="store_true",
+        help="Run the embedding model on CPU even if a GPU is available",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of PDF parsing processes (default: half the CPU count; 1 parses serially)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk parse, embedding and topic caches",
+    )
+
+    parser.add_argument(
+        "--topic-cache",
+        action="store_true",
+        help="Reuse the approximate scores of a similar earlier topic over the same PDFs instead of rescoring",
     )
 
     return parser
@@ -211,57 +251,78 @@ def run_paperlens_agent(args):
 
     def display_results(papers: List[AcademicPaper], research_topic: str):
         """Display the ranked papers in a formatted way."""
-        print("\n" + "=" * 80)
-        print("PAPERLENS - Research Paper Discovery Results")
-        print("=" * 80)
-        print(f"\nResearch Topic:\n{research_topic[:200]}{'...' if len(research_topic) > 200 else ''}\n")
-        print(f"Found {len(papers)} relevant papers:\n")
-        print("=" * 80)
+        # Build the whole report and write it at once rather than one print per line
+        lines = [
+            "\n" + "=" * 80,
+            "PAPERLENS - Research Paper Discovery Results",
+            "=" * 80,
+            f"\nResearch Topic:\n{research_topic[:200]}{'...' if len(research_topic) > 200 else ''}\n",
+            f"Found {len(papers)} relevant papers:\n",
+            "=" * 80,
+        ]
 
         for i, paper in enumerate(papers, 1):
-            print(f"\n[{i}] {paper.display_title}")
-            print(f"    Authors: {paper.display_authors}")
+            lines.append(f"\n[{i}] {paper.display_title}")
+            lines.append(f"    Authors: {paper.display_authors}")
             if paper.paper_metadata.year:
-                print(f"    Year: {paper.paper_metadata.year}")
+                lines.append(f"    Year: {paper.paper_metadata.year}")
             if paper.paper_metadata.venue:
-                print(f"    Venue: {paper.paper_metadata.venue}")
-            print(f"    Similarity Score: {paper.similarity_score:.4f}")
-            print(f"    File: {paper.file_metadata.file_path}")
+                lines.append(f"    Venue: {paper.paper_metadata.venue}")
+            lines.append(f"    Similarity Score: {paper.similarity_score:.4f}")
+            lines.append(f"    File: {paper.file_metadata.file_path}")
 
             if paper.paper_metadata.abstract:
                 abstract = paper.paper_metadata.abstract
                 if len(abstract) > 300:
                     abstract = abstract[:300] + "..."
-                print(f"    Abstract: {abstract}")
+                lines.append(f"    Abstract: {abstract}")
 
             if paper.parsing_errors:
-                print(f"    ⚠️  Parsing warnings: {len(paper.parsing_errors)}")
+                lines.append(f"    ⚠️  Parsing warnings: {len(paper.parsing_errors)}")
 
-        print("\n" + "=" * 80)
+        lines.append("\n" + "=" * 80)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     # Load research topic
     research_topic = load_research_topic(args.input)
 
     # Initialize engine
-    engine = PaperLensEngine(sbert_model=args.model, force_gpu=args.force_gpu)
+    engine = PaperLensEngine(
+        sbert_model=args.model,
+        force_gpu=args.force_gpu,
+        force_cpu=args.force_cpu,
+        use_embedding_cache=not args.no_cache,
+        use_topic_cache=args.topic_cache and not args.no_cache,
+        use_extraction_cache=not args.no_cache,
+    )
 
     # Scan and parse PDFs
-    papers = engine.scan_pdf_directory(args.directory, recursive=not args.no_recursive)
+    papers = engine.scan_pdf_directory(
+        args.directory,
+        recursive=not args.no_recursive,
+        max_workers=args.jobs,
+        min_size=args.min_size,
+        max_size=args.max_size,
+    )
 
     if not papers:
         logger.error("No papers were successfully parsed. Exiting.")
         sys.exit(1)
 
-    # Calculate similarity
-    papers = engine.calculate_similarity(research_topic, papers)
-
-    # Rank papers
-    top_papers = engine.rank_papers(papers, top_n=args.top_n)
+    # Calculate similarity and rank papers
+    top_papers = engine.search(research_topic, papers, top_n=args.top_n)
 
     # Display results
     display_results(top_papers, research_topic)
 
 
+AGENT_PARSERS = {
+    "paperscout_agent": create_paperscout_parser,
+    "paperlens_agent": create_paperlens_parser,
+}
+
+
 def main():
     """Main entry point for Alithia."""
     parser = argparse.ArgumentParser(
@@ -285,9 +346,13 @@ For more information on each agent, use:
     # Create subparsers for different agents
     subparsers = parser.add_subparsers(dest="agent", help="Agent to run", required=True)
 
-    # Add agent parsers
-    create_paperscout_parser(subparsers)
-    create_paperlens_parser(subparsers)
+    # Only build the parser of the requested agent; top-level help and errors need all of them
+    agent = sys.argv[1] if len(sys.argv) > 1 else None
+    if agent in AGENT_PARSERS:
+        AGENT_PARSERS[agent](subparsers)
+    else:
+        for create_parser in AGENT_PARSERS.values():
+            create_parser(subparsers)
 
     # Parse arguments
     args = parser.parse_args()
@@ -155,7 +155,7 @@ class StorageBackend(ABC):
 
         Args:
             user_id: User identifier
-            file_hash: MD5 hash of the PDF file
+            file_hash: Content hash of the PDF file
 
         Returns:
             Cached paper data or None if not found
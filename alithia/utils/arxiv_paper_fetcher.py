@@ -28,12 +28,13 @@ import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import BinaryIO, List, Optional
 
 import arxiv
-import feedparser
 import requests
-from requests.adapters import HTTPAdapter, Retry
+from lxml import etree
+from requests.adapters import Retry
 
 from alithia.constants import (
     ARXIV_BATCH_SIZE,
@@ -44,9 +45,18 @@ from alithia.constants import (
     DEFAULT_RETRY_DELAY,
 )
 from alithia.models import ArxivPaper
+from alithia.utils.rate_limiter import ARXIV_RATE_LIMITER, RateLimitedAdapter
 
 logger = logging.getLogger(__name__)
 
+# Qualified tag names of the ArXiv Atom RSS feed
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_FEED = f"{_ATOM_NS}feed"
+_ATOM_ENTRY = f"{_ATOM_NS}entry"
+_ATOM_TITLE = f"{_ATOM_NS}title"
+_ATOM_ID = f"{_ATOM_NS}id"
+_ARXIV_ANNOUNCE_TYPE = "{http://arxiv.org/schemas/atom}announce_type"
+
 __all__ = [
     "FetchStrategy",
     "FetchResult",
@@ -59,10 +69,14 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=256)
 def _build_category_query(arxiv_query: str) -> str:
     """
     Build category query string from arxiv_query format.
 
+    Results are memoized, since the same category string is expanded for every
+    date window and retry.
+
     Args:
         arxiv_query: ArXiv query string with categories separated by '+' (e.g., "cs.AI+cs.CV+cs.LG")
 
@@ -110,6 +124,48 @@ def build_arxiv_search_query(arxiv_query: str, from_time: str, to_time: str) ->
     return f"({category_query}) AND {date_query}"
 
 
+def _parse_rss_new_ids(source: BinaryIO, max_results: int) -> List[str]:
+    """
+    Extract the IDs of newly announced papers from an ArXiv Atom RSS feed.
+
+    The feed is parsed incrementally as it is read, each entry is discarded once
+    read, and parsing stops as soon as ``max_results`` IDs are collected, so the
+    rest of a large feed is never read or parsed.
+
+    Args:
+        source: Binary file-like object with the feed XML (e.g. a streamed response body)
+        max_results: Maximum number of IDs to return
+
+    Returns:
+        ArXiv IDs of entries announced as "new", in feed order
+
+    Raises:
+        ValueError: If the feed reports an invalid query
+    """
+    paper_ids = []
+    if max_results <= 0:
+        return paper_ids
+
+    for _, elem in etree.iterparse(source, events=("end",), tag=(_ATOM_TITLE, _ATOM_ENTRY)):
+        if elem.tag == _ATOM_TITLE:
+            # The feed title (as opposed to entry titles) reports invalid queries
+            if elem.getparent().tag == _ATOM_FEED and "Feed error for query" in (elem.text or ""):
+                raise ValueError(f"Invalid ArXiv query: {elem.text}")
+            continue
+
+        if elem.findtext(_ARXIV_ANNOUNCE_TYPE) == "new":
+            paper_ids.append(elem.findtext(_ATOM_ID, "").removeprefix("oai:arXiv.org:"))
+            if len(paper_ids) >= max_results:
+                break
+
+        # Free the parsed entry and everything before it
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    return paper_ids
+
+
 class FetchStrategy(Enum):
     """Available ArXiv paper fetching strategies."""
 
@@ -170,7 +226,11 @@ class ArxivPaperFetcher:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep connections alive across strategies and pages; the pool is shared with the web scraper.
+        # Requests are spaced per host by the process-wide ArXiv rate limiter.
+        adapter = RateLimitedAdapter(
+            ARXIV_RATE_LIMITER, pool_connections=4, pool_maxsize=16, max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -337,20 +397,13 @@ class ArxivPaperFetcher:
                 feed_url = f"https://rss.arxiv.org/atom/{arxiv_query}"
                 logger.info(f"RSS feed URL: {feed_url}")
 
-                feed = feedparser.parse(feed_url)
-
-                # Check for feed errors
-                if "Feed error for query" in feed.feed.get("title", ""):
-                    raise ValueError(f"Invalid ArXiv query: {arxiv_query}")
+                # Stream the body into the parser so it can stop reading after max_results entries
+                with self.session.get(feed_url, timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
 
-                # Extract paper IDs from feed (only new papers)
-                paper_ids = []
-                for entry in feed.entries:
-                    if hasattr(entry, "arxiv_announce_type") and entry.arxiv_announce_type == "new":
-                        paper_id = entry.id.removeprefix("oai:arXiv.org:")
-                        paper_ids.append(paper_id)
-                        if len(paper_ids) >= max_results:
-                            break
+                    # Extract paper IDs from feed (only new papers)
+                    paper_ids = _parse_rss_new_ids(response.raw, max_results)
 
                 if not paper_ids:
                     logger.warning("No new papers found in RSS feed")
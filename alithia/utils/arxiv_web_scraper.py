@@ -7,17 +7,53 @@ when API and RSS feed methods fail.
 
 import logging
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Optional
 
 import requests
-from bs4 import BeautifulSoup
-
-from alithia.constants import ARXIV_PAGE_SIZE, DEFAULT_ARXIV_MAX_RESULTS, DEFAULT_REQUEST_TIMEOUT
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import Retry
+
+from alithia.constants import (
+    ARXIV_CACHE_EXPIRE_AFTER,
+    ARXIV_PAGE_SIZE,
+    DEFAULT_ARXIV_CACHE_DIR,
+    DEFAULT_ARXIV_MAX_RESULTS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 from alithia.models import ArxivPaper
+from alithia.utils.rate_limiter import ARXIV_RATE_LIMITER, RateLimitedAdapter
+
+try:
+    import requests_cache
+except ImportError:
+    # Optional: on-disk cache of scraped pages (pip install requests-cache)
+    requests_cache = None
 
 logger = logging.getLogger(__name__)
 
+_ABS_LINK_RE = re.compile(r"/abs/")
+_ABS_ID_RE = re.compile(r"/abs/(\d+\.\d+)")
+_TITLE_PREFIX_RE = re.compile(r"^Title:\s*")
+_DATE_RE = re.compile(r"(\d+\s+\w+\s+\d{4})")
+_SUBMITTED_DATE_RE = re.compile(r"Submitted\s+(\d+\s+\w+\s+\d{4})")
+_DATELINE_DATE_RE = re.compile(r"\[Submitted.*?(\d+\s+\w+\s+\d{4})")
+
+_SEARCH_RESULT_STRAINER = SoupStrainer("li", class_="arxiv-result")
+
+
+@lru_cache(maxsize=256)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a "DD MMM YYYY" date; listings repeat the same few dates, so results are cached."""
+    try:
+        return datetime.strptime(date_str, "%d %b %Y")
+    except ValueError:
+        return None
+
 
 class ArxivWebScraper:
     """
@@ -32,16 +68,19 @@ class ArxivWebScraper:
         session: Optional[requests.Session] = None,
         timeout: int = DEFAULT_REQUEST_TIMEOUT,
         user_agent: str = "AlithiaResearchAssistant/1.0",
+        use_cache: bool = True,
     ):
         """
         Initialize the web scraper.
 
         Args:
-            session: Requests session (or creates new one)
+            session: Requests session (or creates a pooled one with retries)
             timeout: Request timeout (seconds)
             user_agent: User agent string for requests
+            use_cache: Whether a created session serves repeated requests from an on-disk cache
+                       (requires requests-cache; ignored when ``session`` is given)
         """
-        self.session = session or requests.Session()
+        self.session = session or self._create_session(use_cache)
         self.timeout = timeout
         self.base_url = "https://arxiv.org"
 
@@ -54,6 +93,34 @@ class ArxivWebScraper:
             }
         )
 
+    @staticmethod
+    def _create_session(use_cache: bool = True) -> requests.Session:
+        """Create a rate-limited session that keeps connections alive and retries transient errors."""
+        if use_cache and requests_cache is not None:
+            cache_dir = Path(DEFAULT_ARXIV_CACHE_DIR).expanduser()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Pages are cached per URL for an hour; stale pages are served if arXiv is unreachable
+            session = requests_cache.CachedSession(
+                str(cache_dir / "http_cache"),
+                backend="sqlite",
+                expire_after=ARXIV_CACHE_EXPIRE_AFTER,
+                allowable_codes=(200,),
+                stale_if_error=True,
+            )
+        else:
+            session = requests.Session()
+        retry_strategy = Retry(
+            total=DEFAULT_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = RateLimitedAdapter(
+            ARXIV_RATE_LIMITER, pool_connections=4, pool_maxsize=16, max_retries=retry_strategy
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def scrape_arxiv_search(
         self,
         arxiv_query: str,
@@ -87,8 +154,10 @@ class ArxivWebScraper:
             response = self.session.get(list_url, timeout=self.timeout)
             response.raise_for_status()
 
-            # Parse results
-            papers = self._parse_search_results(response.text)
+            # Parse results; without a date filter, stop once max_results papers are parsed.
+            # (The page size itself cannot be lowered: /search ignores size parameters.)
+            limit = None if (from_date or to_date) else max_results
+            papers = self._parse_search_results(response.text, limit=limit)
 
             if not papers:
                 logger.info("No papers found")
@@ -137,12 +206,13 @@ class ArxivWebScraper:
         url = f"{self.base_url}/search/?query={arxiv_query}&searchtype=all"
         return url
 
-    def _parse_search_results(self, html: str) -> List[ArxivPaper]:
+    def _parse_search_results(self, html: str, limit: Optional[int] = None) -> List[ArxivPaper]:
         """
         Parse ArXiv search results page.
 
         Args:
             html: HTML content of search results page
+            limit: Stop after this many papers (None to parse all)
 
         Returns:
             List of ArxivPaper objects
@@ -150,12 +220,14 @@ class ArxivWebScraper:
         papers = []
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # ArXiv search results use <li class="arxiv-result"> for each paper
+            # ArXiv search results use <li class="arxiv-result"> for each paper;
+            # build the tree for those elements only and skip the page chrome
+            soup = BeautifulSoup(html, "lxml", parse_only=_SEARCH_RESULT_STRAINER)
             result_items = soup.find_all("li", class_="arxiv-result")
 
             for item in result_items:
+                if limit is not None and len(papers) >= limit:
+                    break
                 try:
                     paper = self._parse_paper_entry_search(item)
                     if paper:
@@ -190,7 +262,7 @@ class ArxivWebScraper:
                 return None
 
             href = arxiv_link.get("href", "")
-            arxiv_id_match = re.search(r"/abs/(\d+\.\d+)", href)
+            arxiv_id_match = _ABS_ID_RE.search(href)
             if not arxiv_id_match:
                 return None
 
@@ -203,12 +275,12 @@ class ArxivWebScraper:
                 return None
             title = title_elem.get_text(strip=True)
 
-            # Extract authors
+            # Extract authors (interned so that recurring authors share one string across papers)
             authors_elem = item.find("p", class_="authors")
             authors = []
             if authors_elem:
                 author_links = authors_elem.find_all("a")
-                authors = [a.get_text(strip=True) for a in author_links]
+                authors = [sys.intern(a.get_text(strip=True)) for a in author_links]
 
             # Extract abstract (search results don't show abstracts, only list view does)
             # We'll leave summary empty for search results
@@ -220,12 +292,9 @@ class ArxivWebScraper:
             if comments_elem:
                 date_text = comments_elem.get_text()
                 # Try to find date in format "Submitted DD MMM YYYY"
-                date_match = re.search(r"Submitted\s+(\d+\s+\w+\s+\d{4})", date_text)
+                date_match = _SUBMITTED_DATE_RE.search(date_text)
                 if date_match:
-                    try:
-                        published_date = datetime.strptime(date_match.group(1), "%d %b %Y")
-                    except ValueError:
-                        pass
+                    published_date = _parse_date(date_match.group(1))
 
             # Construct PDF URL
             pdf_url = f"{self.base_url}/pdf/{arxiv_id}.pdf"
@@ -258,12 +327,12 @@ class ArxivWebScraper:
         """
         try:
             # Extract ArXiv ID from dt
-            abs_link = dt.find("a", href=re.compile(r"/abs/"))
+            abs_link = dt.find("a", href=_ABS_LINK_RE)
             if not abs_link:
                 return None
 
             href = abs_link.get("href", "")
-            arxiv_id_match = re.search(r"/abs/(\d+\.\d+)", href)
+            arxiv_id_match = _ABS_ID_RE.search(href)
             if not arxiv_id_match:
                 return None
 
@@ -276,7 +345,7 @@ class ArxivWebScraper:
 
             title = title_div.get_text(strip=True)
             # Remove "Title:" prefix if present
-            title = re.sub(r"^Title:\s*", "", title)
+            title = _TITLE_PREFIX_RE.sub("", title)
 
             # Extract authors from dd
             authors_div = dd.find("div", class_="list-authors")
@@ -284,7 +353,7 @@ class ArxivWebScraper:
             if authors_div:
                 # Authors are in <a> tags
                 author_links = authors_div.find_all("a")
-                authors = [a.get_text(strip=True) for a in author_links]
+                authors = [sys.intern(a.get_text(strip=True)) for a in author_links]
 
             # Try to extract submission date from comments
             comments_div = dd.find("div", class_="list-comments")
@@ -292,12 +361,9 @@ class ArxivWebScraper:
             if comments_div:
                 comment_text = comments_div.get_text()
                 # Try to find date in format "DD MMM YYYY"
-                date_match = re.search(r"(\d+\s+\w+\s+\d{4})", comment_text)
+                date_match = _DATE_RE.search(comment_text)
                 if date_match:
-                    try:
-                        published_date = datetime.strptime(date_match.group(1), "%d %b %Y")
-                    except ValueError:
-                        pass
+                    published_date = _parse_date(date_match.group(1))
 
             # Construct PDF URL
             pdf_url = f"{self.base_url}/pdf/{arxiv_id}.pdf"
@@ -343,7 +409,7 @@ class ArxivWebScraper:
 
             href = link.get("href", "")
             # Extract ID from URL like /abs/2312.12345
-            arxiv_id_match = re.search(r"/abs/(\d+\.\d+)", href)
+            arxiv_id_match = _ABS_ID_RE.search(href)
             if not arxiv_id_match:
                 return None
 
@@ -360,7 +426,7 @@ class ArxivWebScraper:
             authors = []
             if authors_elem:
                 author_links = authors_elem.find_all("a")
-                authors = [a.get_text(strip=True) for a in author_links]
+                authors = [sys.intern(a.get_text(strip=True)) for a in author_links]
 
             # Extract abstract/summary
             abstract_elem = entry.find("span", class_="abstract-full")
@@ -377,12 +443,9 @@ class ArxivWebScraper:
             if submitted_elem:
                 date_text = submitted_elem.get_text()
                 # Try to extract date like "Submitted 23 Dec 2023"
-                date_match = re.search(r"Submitted\s+(\d+\s+\w+\s+\d{4})", date_text)
+                date_match = _SUBMITTED_DATE_RE.search(date_text)
                 if date_match:
-                    try:
-                        published_date = datetime.strptime(date_match.group(1), "%d %b %Y")
-                    except ValueError:
-                        pass
+                    published_date = _parse_date(date_match.group(1))
 
             # Construct PDF URL
             pdf_url = f"{self.base_url}/pdf/{arxiv_id}.pdf"
@@ -451,7 +514,7 @@ class ArxivWebScraper:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, "lxml")
 
             # Extract title
             title_elem = soup.find("h1", class_="title")
@@ -464,7 +527,7 @@ class ArxivWebScraper:
             authors = []
             if authors_elem:
                 author_links = authors_elem.find_all("a")
-                authors = [a.get_text(strip=True) for a in author_links]
+                authors = [sys.intern(a.get_text(strip=True)) for a in author_links]
 
             # Extract abstract
             abstract_elem = soup.find("blockquote", class_="abstract")
@@ -477,12 +540,9 @@ class ArxivWebScraper:
             published_date = None
             if dateline_elem:
                 date_text = dateline_elem.get_text()
-                date_match = re.search(r"\[Submitted.*?(\d+\s+\w+\s+\d{4})", date_text)
+                date_match = _DATELINE_DATE_RE.search(date_text)
                 if date_match:
-                    try:
-                        published_date = datetime.strptime(date_match.group(1), "%d %b %Y")
-                    except ValueError:
-                        pass
+                    published_date = _parse_date(date_match.group(1))
 
             # Construct PDF URL
             pdf_url = f"{self.base_url}/pdf/{arxiv_id}.pdf"
@@ -502,3 +562,19 @@ class ArxivWebScraper:
         except Exception as e:
             logger.error(f"Error scraping paper details for {arxiv_id}: {e}")
             return None
+
+    def scrape_paper_details_many(self, arxiv_ids: List[str]) -> List[Optional[ArxivPaper]]:
+        """
+        Scrape detailed information for several papers.
+
+        Pages are fetched one after another: the session's adapter waits on ARXIV_RATE_LIMITER
+        before every request, which allows one request per ARXIV_REQUEST_INTERVAL to arxiv.org,
+        so throughput is set by the limiter and concurrent requests would only queue behind it.
+
+        Args:
+            arxiv_ids: ArXiv IDs (e.g., ["2312.12345", "2005.14165"])
+
+        Returns:
+            ArxivPaper objects (None where scraping failed), in the same order as ``arxiv_ids``
+        """
+        return [self.scrape_paper_details(arxiv_id) for arxiv_id in arxiv_ids]
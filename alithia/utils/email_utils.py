@@ -7,17 +7,148 @@ from datetime import datetime
 from email.header import Header
 from email.mime.text import MIMEText
 from email.utils import formataddr, parseaddr
+from typing import Optional
 
 from cogents_core.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+def _format_addr(s: str) -> str:
+    name, addr = parseaddr(s)
+    return formataddr((Header(name, "utf-8").encode(), addr))
+
+
+class EmailSender:
+    """
+    SMTP session that can deliver several emails over a single connection.
+
+    The TLS/SSL handshake and login happen once, on the first send (or on entering
+    the context manager), and are reused by subsequent sends until close().
+
+    Example:
+        with EmailSender(sender, password, smtp_server, smtp_port) as email_sender:
+            for receiver, html in digests:
+                email_sender.send(receiver, html)
+    """
+
+    def __init__(self, sender: str, password: str, smtp_server: str, smtp_port: int, timeout: float = 30):
+        """
+        Initialize the sender.
+
+        Args:
+            sender: Sender email address
+            password: Sender email password
+            smtp_server: SMTP server address
+            smtp_port: SMTP server port
+            timeout: Socket timeout in seconds
+        """
+        self.sender = sender
+        self.password = password
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.timeout = timeout
+        self.server: Optional[smtplib.SMTP] = None
+        self._from_addr = _format_addr(f"Github Action <{sender}>")
+
+    def connect(self) -> None:
+        """
+        Connect (TLS, falling back to SSL) and log in, if not connected yet.
+
+        Raises:
+            ConnectionError: If neither a TLS nor an SSL connection can be established
+            smtplib.SMTPException: If login fails
+        """
+        if self.server is not None:
+            return
+
+        server = None
+        try:
+            logger.info(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port} (TLS)...")
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.timeout)
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            logger.info("Connected successfully with TLS")
+        except Exception as e:
+            logger.warning(f"TLS connection failed: {e}, trying SSL...")
+            self._quit(server)
+            try:
+                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=self.timeout)
+                server.ehlo()
+                logger.info("Connected successfully with SSL")
+            except Exception as ssl_error:
+                raise ConnectionError(
+                    f"Failed to connect to SMTP server: TLS error: {e}, SSL error: {ssl_error}"
+                ) from ssl_error
+
+        try:
+            logger.info(f"Logging in as {self.sender}...")
+            server.login(self.sender, self.password)
+            logger.info("Login successful")
+        except Exception:
+            self._quit(server)
+            raise
+
+        self.server = server
+
+    def send(self, receiver: str, html_content: str, subject: Optional[str] = None) -> None:
+        """
+        Send an HTML email over the open connection, connecting first if needed.
+
+        Args:
+            receiver: Receiver email address
+            html_content: HTML content to send
+            subject: Email subject (optional, defaults to "Alithia Digest {date}")
+
+        Raises:
+            ConnectionError: If the SMTP server cannot be reached
+            smtplib.SMTPException: If login or delivery fails
+        """
+        if subject is None:
+            today = datetime.now().strftime("%Y/%m/%d")
+            subject = f"Alithia Digest {today}"
+
+        msg = MIMEText(html_content, "html", "utf-8")
+        msg["From"] = self._from_addr
+        msg["To"] = _format_addr(f"You <{receiver}>")
+        msg["Subject"] = Header(subject, "utf-8").encode()
+
+        self.connect()
+        logger.info(f"Sending email to {receiver} with subject: {subject}")
+        # send_message serializes the message as bytes instead of building an intermediate str copy
+        self.server.send_message(msg, from_addr=self.sender, to_addrs=[receiver])
+        logger.info("Email sent successfully")
+
+    def close(self) -> None:
+        """Close the SMTP connection."""
+        self._quit(self.server)
+        self.server = None
+
+    @staticmethod
+    def _quit(server: Optional[smtplib.SMTP]) -> None:
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "EmailSender":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
 def send_email(
     sender: str, receiver: str, password: str, smtp_server: str, smtp_port: int, html_content: str, subject: str = None
 ) -> bool:
     """
-    Send email via SMTP.
+    Send a single email via SMTP.
+
+    Use EmailSender directly to send several emails over one connection.
 
     Args:
         sender: Sender email address
@@ -35,58 +166,10 @@ def send_email(
         logger.error("Email configuration is incomplete or invalid")
         return False
 
-    def _format_addr(s):
-        name, addr = parseaddr(s)
-        return formataddr((Header(name, "utf-8").encode(), addr))
-
-    msg = MIMEText(html_content, "html", "utf-8")
-    msg["From"] = _format_addr(f"Github Action <{sender}>")
-    msg["To"] = _format_addr(f"You <{receiver}>")
-
-    if subject is None:
-        today = datetime.now().strftime("%Y/%m/%d")
-        subject = f"Alithia Digest {today}"
-
-    msg["Subject"] = Header(subject, "utf-8").encode()
-
-    server = None
     try:
-        logger.info(f"Connecting to SMTP server {smtp_server}:{smtp_port} (TLS)...")
-        server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-        server.ehlo()
-        server.starttls()
-        server.ehlo()
-        logger.info("Connected successfully with TLS")
-    except Exception as e:
-        logger.warning(f"TLS connection failed: {e}, trying SSL...")
-        if server:
-            try:
-                server.quit()
-            except:
-                pass
-        try:
-            server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-            server.ehlo()
-            logger.info("Connected successfully with SSL")
-        except Exception as ssl_error:
-            logger.error(f"Failed to connect to SMTP server: TLS error: {e}, SSL error: {ssl_error}")
-            return False
-
-    try:
-        logger.info(f"Logging in as {sender}...")
-        server.login(sender, password)
-        logger.info("Login successful")
-        
-        logger.info(f"Sending email to {receiver} with subject: {subject}")
-        server.sendmail(sender, [receiver], msg.as_string())
-        logger.info("Email sent successfully")
+        with EmailSender(sender, password, smtp_server, smtp_port) as email_sender:
+            email_sender.send(receiver, html_content, subject)
         return True
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
         return False
-    finally:
-        if server:
-            try:
-                server.quit()
-            except:
-                pass
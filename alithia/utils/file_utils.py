@@ -0,0 +1,108 @@
+"""
+File utilities shared across agents.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Read size for streamed hashing (1 MiB)
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _new_hasher():
+    return blake3.blake3() if blake3 is not None else hashlib.blake2b(digest_size=32)
+
+
+def compute_file_hash(file_path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    Compute a content hash of a file without loading it into memory.
+
+    When the ``blake3`` package is installed the file is memory-mapped and hashed
+    by BLAKE3 (SIMD-accelerated, multithreaded for large files); otherwise it is
+    streamed in fixed-size chunks through stdlib BLAKE2b. The digest is used as a
+    content address (cache key), not as a security token.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Number of bytes read per chunk (BLAKE2b fallback only)
+
+    Returns:
+        Hex digest of the file content
+    """
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(file_path).hexdigest()
+
+    hasher = _new_hasher()
+    # Read into one reusable buffer (as hashlib.file_digest does) instead of allocating per chunk
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+
+def compute_bytes_hash(data: bytes) -> str:
+    """
+    Compute the content hash of in-memory file content.
+
+    Produces the same digest as compute_file_hash for a file with this content.
+
+    Args:
+        data: File content
+
+    Returns:
+        Hex digest of the content
+    """
+    hasher = _new_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def iter_files(
+    directory: Path,
+    suffix: str,
+    recursive: bool = True,
+    min_size: int = 0,
+    max_size: Optional[int] = None,
+) -> Iterator[Path]:
+    """
+    Iterate over files with a given suffix using ``os.scandir``.
+
+    Only entries whose name matches are stat'ed, hidden files and directories are
+    skipped, and symlinks are not followed.
+
+    Args:
+        directory: Directory to search
+        suffix: File name suffix to match, case-insensitively (e.g. ".pdf")
+        recursive: Whether to search subdirectories
+        min_size: Skip files smaller than this many bytes
+        max_size: Skip files larger than this many bytes (no limit if None)
+
+    Yields:
+        Paths of matching files
+    """
+    suffix = suffix.lower()
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith(suffix) and entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
+                        if size >= min_size and (max_size is None or size <= max_size):
+                            yield Path(entry.path)
+        except OSError:
+            continue
@@ -0,0 +1,76 @@
+"""
+Per-host rate limiting for HTTP sessions.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+from alithia.constants import ARXIV_REQUEST_INTERVAL
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter enforcing a minimum interval between requests to the same host.
+
+    Requests are handed consecutive time slots per host, so concurrent callers queue up
+    instead of bursting and getting throttled or banned by the server.
+    """
+
+    def __init__(self, min_interval: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between two requests to the same host
+        """
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: Optional[str]) -> None:
+        """
+        Block until a request to ``host`` may be sent.
+
+        Args:
+            host: Host name the request goes to
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+
+        # Sleep outside the lock so requests to other hosts are not held up
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that waits for a RateLimiter before sending each request.
+
+    Retries of 429/503 responses configured through ``max_retries`` honor the server's
+    Retry-After header (urllib3 does so by default).
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs):
+        """
+        Initialize the adapter.
+
+        Args:
+            rate_limiter: Limiter shared by all sessions talking to the same hosts
+            **kwargs: Arguments passed to HTTPAdapter (pool sizes, max_retries, ...)
+        """
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.rate_limiter.wait(urlsplit(request.url).hostname)
+        return super().send(request, **kwargs)
+
+
+# Limiter shared by all ArXiv clients in the process (API fetcher, RSS fetcher and web scraper)
+ARXIV_RATE_LIMITER = RateLimiter(ARXIV_REQUEST_INTERVAL)
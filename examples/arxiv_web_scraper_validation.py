@@ -12,10 +12,11 @@ Usage:
 
 Requirements:
     - beautifulsoup4 (bs4)
+    - lxml
     - requests
 
-    Install with: pip install beautifulsoup4 requests
-    Or with uv: uv pip install beautifulsoup4 requests
+    Install with: pip install beautifulsoup4 lxml requests
+    Or with uv: uv pip install beautifulsoup4 lxml requests
 """
 
 import logging
@@ -38,9 +39,9 @@ except ImportError as e:
     print("❌ ERROR: Missing required dependencies")
     print(f"   {e}")
     print("\nPlease install required packages:")
-    print("   pip install beautifulsoup4 requests")
+    print("   pip install beautifulsoup4 lxml requests")
     print("   or")
-    print("   uv pip install beautifulsoup4 requests")
+    print("   uv pip install beautifulsoup4 lxml requests")
     print("\nAnd ensure the alithia package is installed:")
     print("   pip install -e .")
     sys.exit(1)
@@ -48,9 +49,7 @@ except ImportError as e:
 
 def print_section(title: str):
     """Print a formatted section header."""
-    print("\n" + "=" * 80)
-    print(f"  {title}")
-    print("=" * 80 + "\n")
+    sys.stdout.write(f"\n{'=' * 80}\n  {title}\n{'=' * 80}\n\n")
 
 
 def print_paper_summary(papers, max_display=3):
@@ -59,30 +58,31 @@ def print_paper_summary(papers, max_display=3):
         print("❌ No papers found")
         return
 
-    print(f"✅ Found {len(papers)} papers\n")
+    # Collect the summary and write it once instead of issuing one print per line
+    lines = [f"✅ Found {len(papers)} papers\n"]
 
     for i, paper in enumerate(papers[:max_display], 1):
-        print(f"[{i}] {paper.title}")
-        print(f"    ArXiv ID: {paper.arxiv_id}")
-        print(f"    Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}")
+        lines.append(f"[{i}] {paper.title}")
+        lines.append(f"    ArXiv ID: {paper.arxiv_id}")
+        lines.append(f"    Authors: {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}")
         if paper.published_date:
-            print(f"    Published: {paper.published_date.strftime('%Y-%m-%d')}")
-        print(f"    PDF URL: {paper.pdf_url}")
+            lines.append(f"    Published: {paper.published_date.strftime('%Y-%m-%d')}")
+        lines.append(f"    PDF URL: {paper.pdf_url}")
         if paper.summary:
             summary_preview = paper.summary[:150] + "..." if len(paper.summary) > 150 else paper.summary
-            print(f"    Abstract: {summary_preview}")
-        print()
+            lines.append(f"    Abstract: {summary_preview}")
+        lines.append("")
 
     if len(papers) > max_display:
-        print(f"    ... and {len(papers) - max_display} more papers\n")
+        lines.append(f"    ... and {len(papers) - max_display} more papers\n")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def test_basic_search():
+def test_basic_search(scraper: ArxivWebScraper):
     """Test basic ArXiv search functionality."""
     print_section("Test 1: Basic Search (cs.AI)")
 
-    scraper = ArxivWebScraper()
-
     try:
         papers = scraper.scrape_arxiv_search(
             arxiv_query="cs.AI",
@@ -93,9 +93,10 @@ def test_basic_search():
 
         # Validate results
         assert len(papers) > 0, "Should return at least some papers"
-        assert all(paper.arxiv_id for paper in papers), "All papers should have ArXiv IDs"
-        assert all(paper.title for paper in papers), "All papers should have titles"
-        assert all(paper.pdf_url for paper in papers), "All papers should have PDF URLs"
+        for paper in papers:
+            assert paper.arxiv_id, "All papers should have ArXiv IDs"
+            assert paper.title, f"All papers should have titles ({paper.arxiv_id})"
+            assert paper.pdf_url, f"All papers should have PDF URLs ({paper.arxiv_id})"
 
         print("✅ Basic search validation PASSED")
 
@@ -104,12 +105,10 @@ def test_basic_search():
         raise
 
 
-def test_multiple_categories():
+def test_multiple_categories(scraper: ArxivWebScraper):
     """Test searching multiple categories."""
     print_section("Test 2: Multiple Categories (cs.AI+cs.CV+cs.LG)")
 
-    scraper = ArxivWebScraper()
-
     try:
         papers = scraper.scrape_arxiv_search(
             arxiv_query="cs.AI+cs.CV+cs.LG",
@@ -128,12 +127,10 @@ def test_multiple_categories():
         raise
 
 
-def test_date_filtering():
+def test_date_filtering(scraper: ArxivWebScraper):
     """Test date range filtering."""
     print_section("Test 3: Date Filtering")
 
-    scraper = ArxivWebScraper()
-
     # Get papers from last week
     to_date = datetime.now()
     from_date = to_date - timedelta(days=7)
@@ -152,10 +149,11 @@ def test_date_filtering():
 
         # Validate date filtering
         if papers:
+            latest_date = to_date + timedelta(days=1)
             for paper in papers:
                 if paper.published_date:
                     assert (
-                        from_date <= paper.published_date <= to_date + timedelta(days=1)
+                        from_date <= paper.published_date <= latest_date
                     ), f"Paper date {paper.published_date} should be within range"
 
             print("✅ Date filtering validation PASSED")
@@ -167,12 +165,10 @@ def test_date_filtering():
         raise
 
 
-def test_pagination():
+def test_pagination(scraper: ArxivWebScraper):
     """Test pagination with multiple results."""
     print_section("Test 4: Pagination (requesting more than one page)")
 
-    scraper = ArxivWebScraper()
-
     # Request more than the default page size
     max_results = ARXIV_PAGE_SIZE + 10
     print(f"Requesting {max_results} papers (page size: {ARXIV_PAGE_SIZE})\n")
@@ -200,12 +196,10 @@ def test_pagination():
         raise
 
 
-def test_paper_details_scraping():
+def test_paper_details_scraping(scraper: ArxivWebScraper):
     """Test scraping individual paper details."""
     print_section("Test 5: Individual Paper Details Scraping")
 
-    scraper = ArxivWebScraper()
-
     # Use a well-known paper ID (GPT-3 paper)
     test_arxiv_id = "2005.14165"
     print(f"Fetching details for paper: {test_arxiv_id}\n")
@@ -242,12 +236,10 @@ def test_paper_details_scraping():
         raise
 
 
-def test_error_handling():
+def test_error_handling(scraper: ArxivWebScraper):
     """Test error handling with invalid inputs."""
     print_section("Test 6: Error Handling")
 
-    scraper = ArxivWebScraper()
-
     # Test 1: Invalid category
     print("Testing invalid category (should handle gracefully)...")
     try:
@@ -274,14 +266,12 @@ def test_error_handling():
     print("✅ Error handling validation PASSED")
 
 
-def run_performance_test():
+def run_performance_test(scraper: ArxivWebScraper):
     """Test performance of the web scraper."""
     print_section("Test 7: Performance Benchmark")
 
     import time
 
-    scraper = ArxivWebScraper()
-
     print("Fetching 20 papers to measure performance...\n")
     start_time = time.time()
 
@@ -316,6 +306,9 @@ def main():
     print("  ArXiv Web Scraper Validation Suite")
     print("🔍" * 40)
 
+    # One scraper (and HTTP connection pool) shared by all tests
+    scraper = ArxivWebScraper()
+
     tests = [
         ("Basic Search", test_basic_search),
         ("Multiple Categories", test_multiple_categories),
@@ -330,7 +323,7 @@ def main():
 
     for test_name, test_func in tests:
         try:
-            test_func()
+            test_func(scraper)
             results[test_name] = "✅ PASSED"
         except Exception as e:
             results[test_name] = f"❌ FAILED: {str(e)}"
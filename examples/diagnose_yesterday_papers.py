@@ -8,13 +8,27 @@ This script tests various scenarios to understand:
 4. Why yesterday's query might return 0 papers
 """
 
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from io import BytesIO
+
+from lxml import etree
 
 from alithia.utils.arxiv_paper_fetcher import (
     ArxivPaperFetcher,
     build_arxiv_search_query,
 )
 
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def day_range(date: datetime) -> tuple:
+    """Return the (from_time, to_time) pair in ArXiv's YYYYMMDDHHMM format covering the given day."""
+    day = date.strftime("%Y%m%d")
+    return f"{day}0000", f"{day}2359"
+
 
 def test_yesterday_query():
     """Test querying for yesterday's papers."""
@@ -24,8 +38,7 @@ def test_yesterday_query():
 
     # Calculate yesterday
     yesterday = datetime.now() - timedelta(days=1)
-    from_time = yesterday.strftime("%Y%m%d") + "0000"
-    to_time = yesterday.strftime("%Y%m%d") + "2359"
+    from_time, to_time = day_range(yesterday)
 
     print(f"Yesterday: {yesterday.strftime('%Y-%m-%d')}")
     print(f"Date range: {from_time} to {to_time}")
@@ -90,11 +103,9 @@ def test_recent_papers_no_date_filter():
             print(f"  Date range: {(most_recent - oldest).days} days")
 
             # Count papers by date
-            from collections import Counter
-
             date_counts = Counter(d.strftime("%Y-%m-%d") for d in dates)
             print(f"\nPapers by date (most recent first):")
-            for date, count in sorted(date_counts.items(), reverse=True)[:10]:
+            for date, count in heapq.nlargest(10, date_counts.items()):
                 print(f"  {date}: {count} papers")
     else:
         print("⚠️  No papers found in RSS feed!")
@@ -125,8 +136,7 @@ def test_date_format_verification():
         return
 
     test_date = recent_paper.published_date
-    from_time = test_date.strftime("%Y%m%d") + "0000"
-    to_time = test_date.strftime("%Y%m%d") + "2359"
+    from_time, to_time = day_range(test_date)
 
     print(f"Testing date format with known date: {test_date.strftime('%Y-%m-%d')}")
     print(f"Date range format: {from_time} to {to_time}")
@@ -166,22 +176,27 @@ def test_multiple_date_ranges():
 
     fetcher = ArxivPaperFetcher(max_retries=1)
 
-    # Test last 7 days
-    for days_ago in range(7):
-        test_date = datetime.now() - timedelta(days=days_ago)
-        from_time = test_date.strftime("%Y%m%d") + "0000"
-        to_time = test_date.strftime("%Y%m%d") + "2359"
-
-        result = fetcher._fetch_with_api_search(
+    def fetch_day(test_date):
+        from_time, to_time = day_range(test_date)
+        return fetcher._fetch_with_api_search(
             arxiv_query="cs.AI",
             from_time=from_time,
             to_time=to_time,
             max_results=5,
         )
 
-        date_str = test_date.strftime("%Y-%m-%d")
-        status = "✅" if len(result.papers) > 0 else "❌"
-        print(f"{status} {date_str}: {len(result.papers)} papers")
+    # Test last 7 days; the days are independent, so query them concurrently.
+    # Keep the pool small to stay close to ArXiv's request-rate guidance.
+    # Read the clock once so all windows are relative to the same instant, even across midnight
+    now = datetime.now()
+    test_dates = [now - timedelta(days=days_ago) for days_ago in range(7)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(fetch_day, test_dates)
+
+        for test_date, result in zip(test_dates, results):
+            date_str = test_date.strftime("%Y-%m-%d")
+            status = "✅" if len(result.papers) > 0 else "❌"
+            print(f"{status} {date_str}: {len(result.papers)} papers")
 
     print()
 
@@ -192,8 +207,6 @@ def test_category_query():
     print("Test 5: Category Query Test (No Date Filter)")
     print("=" * 80)
 
-    import arxiv
-
     categories = "cs.AI+cs.CV+cs.LG+cs.CL"
     category_query = "cat:cs.AI OR cat:cs.CV OR cat:cs.LG OR cat:cs.CL"
 
@@ -201,28 +214,37 @@ def test_category_query():
     print(f"Query: {category_query}")
     print()
 
-    client = arxiv.Client(num_retries=2, delay_seconds=1)
-    search = arxiv.Search(
-        query=category_query,
-        sort_by=arxiv.SortCriterion.SubmittedDate,
-        sort_order=arxiv.SortOrder.Descending,
-        max_results=10,
+    # One raw API request for exactly 10 results, parsed as a stream
+    fetcher = ArxivPaperFetcher()
+    response = fetcher.session.get(
+        "https://export.arxiv.org/api/query",
+        params={
+            "search_query": category_query,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+            "start": 0,
+            "max_results": 10,
+        },
+        timeout=10,
     )
+    response.raise_for_status()
 
     papers = []
-    for result in client.results(search):
-        papers.append(result)
-        if len(papers) >= 10:
-            break
+    for _, entry in etree.iterparse(BytesIO(response.content), events=("end",), tag=f"{ATOM_NS}entry"):
+        papers.append(
+            (
+                entry.findtext(f"{ATOM_NS}id", "").rsplit("/abs/", 1)[-1],
+                entry.findtext(f"{ATOM_NS}published", "")[:10] or "unknown",
+                " ".join(entry.findtext(f"{ATOM_NS}title", "").split()),
+            )
+        )
+        entry.clear()
 
     print(f"Found {len(papers)} papers (no date filter)")
     if papers:
         print("\nMost recent papers:")
-        for i, paper in enumerate(papers[:5], 1):
-            date_str = (
-                paper.published.strftime("%Y-%m-%d") if hasattr(paper, "published") and paper.published else "unknown"
-            )
-            print(f"  {i}. [{date_str}] {paper.get_short_id()} - {paper.title[:50]}...")
+        for i, (arxiv_id, date_str, title) in enumerate(papers[:5], 1):
+            print(f"  {i}. [{date_str}] {arxiv_id} - {title[:50]}...")
     print()
 
 
@@ -1,26 +1,22 @@
 #!/usr/bin/env python3
 """DoclingOCR example: PDF parsing with optional LLM enhancement."""
 
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
 
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-from cogents_core.llm import get_llm_client
-
-from alithia.paperlens.paper_ocr.docling import DoclingOcr
+def separator_lines(title: str = None) -> list:
+    """Return the lines of a formatted separator."""
+    if title:
+        return [f"\n{'=' * 70}", f"  {title}", f"{'=' * 70}\n"]
+    return [f"{'=' * 70}\n"]
 
 
 def print_separator(title: str = None):
     """Print formatted separator."""
-    if title:
-        print(f"\n{'=' * 70}")
-        print(f"  {title}")
-        print(f"{'=' * 70}\n")
-    else:
-        print(f"{'=' * 70}\n")
+    sys.stdout.write("\n".join(separator_lines(title)) + "\n")
 
 
 def display_paper_info(paper):
@@ -29,77 +25,103 @@ def display_paper_info(paper):
         print("❌ Failed to parse PDF")
         return
 
-    print_separator("FILE METADATA")
-    print(f"📄 File Name: {paper.file_metadata.file_name}")
-    print(f"📦 File Size: {paper.file_metadata.file_size / 1024:.2f} KB")
-    print(f"🕒 Last Modified: {paper.file_metadata.last_modified}")
-    print(f"🔐 MD5 Hash: {paper.file_metadata.md5_hash}")
-    print(f"⏱️  Parse Timestamp: {paper.parse_timestamp}")
+    # Collect the report and write it once instead of issuing one print per line
+    lines = separator_lines("FILE METADATA")
+    lines.append(f"📄 File Name: {paper.file_metadata.file_name}")
+    lines.append(f"📦 File Size: {paper.file_metadata.file_size / 1024:.2f} KB")
+    lines.append(f"🕒 Last Modified: {paper.file_metadata.last_modified}")
+    lines.append(f"🔐 Content Hash: {paper.file_metadata.content_hash}")
+    lines.append(f"⏱️  Parse Timestamp: {paper.parse_timestamp}")
 
-    print_separator("PAPER METADATA")
+    lines.extend(separator_lines("PAPER METADATA"))
     meta = paper.paper_metadata
-    print(f"📌 Title: {meta.title or 'Not extracted'}")
-    print(f"\n👥 Authors ({len(meta.authors)}):")
+    lines.append(f"📌 Title: {meta.title or 'Not extracted'}")
+    lines.append(f"\n👥 Authors ({len(meta.authors)}):")
     if meta.authors:
-        for i, author in enumerate(meta.authors, 1):
-            print(f"   {i}. {author}")
+        lines.extend(f"   {i}. {author}" for i, author in enumerate(meta.authors, 1))
     else:
-        print("   Not extracted")
+        lines.append("   Not extracted")
 
-    print(f"\n📅 Year: {meta.year or 'Not extracted'}")
-    print(f"🔖 DOI: {meta.doi or 'Not extracted'}")
-    print(f"🏛️  Venue: {meta.venue or 'Not extracted'}")
+    lines.append(f"\n📅 Year: {meta.year or 'Not extracted'}")
+    lines.append(f"🔖 DOI: {meta.doi or 'Not extracted'}")
+    lines.append(f"🏛️  Venue: {meta.venue or 'Not extracted'}")
 
-    print(f"\n🏷️  Keywords ({len(meta.keywords)}):")
-    if meta.keywords:
-        print(f"   {', '.join(meta.keywords)}")
-    else:
-        print("   Not extracted")
+    lines.append(f"\n🏷️  Keywords ({len(meta.keywords)}):")
+    lines.append(f"   {', '.join(meta.keywords)}" if meta.keywords else "   Not extracted")
 
-    print(f"\n📝 Abstract ({len(meta.abstract) if meta.abstract else 0} characters):")
+    lines.append(f"\n📝 Abstract ({len(meta.abstract) if meta.abstract else 0} characters):")
     if meta.abstract:
         abstract_preview = meta.abstract[:300]
         if len(meta.abstract) > 300:
             abstract_preview += "..."
-        print(f"   {abstract_preview}")
+        lines.append(f"   {abstract_preview}")
     else:
-        print("   Not extracted")
+        lines.append("   Not extracted")
 
-    print_separator("CONTENT STATISTICS")
+    lines.extend(separator_lines("CONTENT STATISTICS"))
     content = paper.content
-    print(f"📖 Full Text Length: {len(content.full_text):,} characters")
-    print(f"📑 Sections: {len(content.sections)}")
-    print(f"📚 References: {len(content.references)}")
-    print(f"🖼️  Figures: {len(content.figures)}")
-    print(f"📊 Tables: {len(content.tables)}")
+    lines.append(f"📖 Full Text Length: {len(content.full_text):,} characters")
+    lines.append(f"📑 Sections: {len(content.sections)}")
+    lines.append(f"📚 References: {len(content.references)}")
+    lines.append(f"🖼️  Figures: {len(content.figures)}")
+    lines.append(f"📊 Tables: {len(content.tables)}")
 
     if paper.parsing_errors:
-        print_separator("PARSING ERRORS")
-        for i, error in enumerate(paper.parsing_errors, 1):
-            print(f"   {i}. {error}")
+        lines.extend(separator_lines("PARSING ERRORS"))
+        lines.extend(f"   {i}. {error}" for i, error in enumerate(paper.parsing_errors, 1))
 
-    print_separator()
+    lines.extend(separator_lines())
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def example_llm_enhanced_parsing(pdf_path: Path):
-    """Enhanced PDF parsing with LLM fallback for incomplete metadata.
+def create_ocr():
+    """Create a DoclingOcr with an LLM client, shared by all parsed PDFs.
     Note: Requires OPENAI_API_KEY environment variable.
     """
-    print("\n🔍 Enhanced PDF Parsing (with LLM)")
-    print_separator()
-    try:
-        print("Initializing DoclingOCR with LLM...")
-        ocr = DoclingOcr(llm=get_llm_client(provider="openrouter"))
-        print("✅ Initialized\n")
-        paper = ocr.parse_file(pdf_path)
-        display_paper_info(paper)
-        return paper
-    except Exception as e:
-        print(f"❌ LLM-enhanced parsing failed: {e}")
-        import traceback
+    # Imported here so the usage message does not wait for docling and the LLM SDK to load
+    from cogents_core.llm import get_llm_client
+
+    from alithia.paperlens.paper_ocr.docling import DoclingOcr
 
-        traceback.print_exc()
-        return None
+    print("Initializing DoclingOCR with LLM...")
+    ocr = DoclingOcr(llm=get_llm_client(provider="openrouter"))
+    print("✅ Initialized\n")
+    return ocr
+
+
+def example_llm_enhanced_parsing(pdf_paths: List[Path], ocr) -> List[Tuple[Path, Optional[object]]]:
+    """Enhanced PDF parsing with LLM fallback for incomplete metadata.
+
+    PDFs are converted with docling one after another while the LLM enhancement of
+    already converted PDFs runs on a thread pool, so LLM round trips overlap with the
+    conversion of the next PDF instead of adding to it.
+    """
+    from alithia.paperlens.paper_ocr.docling import LLM_WORKERS
+
+    pending = []
+    with ThreadPoolExecutor(max_workers=LLM_WORKERS) as executor:
+        for pdf_path in pdf_paths:
+            print(f"\n🔍 Enhanced PDF Parsing (with LLM): {pdf_path.name}")
+            paper, needs_llm = ocr.parse_file_without_llm(pdf_path)
+            future = executor.submit(ocr.enhance_metadata_with_llm, [paper]) if needs_llm else None
+            pending.append((pdf_path, paper, future))
+
+        results = []
+        for pdf_path, paper, future in pending:
+            print_separator(pdf_path.name)
+            try:
+                if future is not None:
+                    future.result()
+            except Exception as e:
+                print(f"❌ LLM-enhanced parsing failed: {e}")
+                import traceback
+
+                traceback.print_exc()
+                paper = None
+            else:
+                display_paper_info(paper)
+            results.append((pdf_path, paper))
+    return results
 
 
 def example_save_to_json(paper, output_path: Path):
@@ -110,8 +132,8 @@ def example_save_to_json(paper, output_path: Path):
 
     print(f"\n💾 Saving to {output_path}")
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(paper.to_dict(), f, indent=2, ensure_ascii=False, default=str)
+        with open(output_path, "wb") as f:
+            paper.write_json(f, indent=True)
         print(f"✅ Saved ({output_path.stat().st_size / 1024:.2f} KB)")
     except Exception as e:
         print(f"❌ Save failed: {e}")
@@ -124,19 +146,26 @@ def main():
     print("=" * 70)
 
     if len(sys.argv) < 2:
-        print("\n⚠️  Usage: python docling_ocr_example.py <path_to_pdf>")
+        print("\n⚠️  Usage: python docling_ocr_example.py <path_to_pdf> [<path_to_pdf> ...]")
         return
 
-    pdf_path = Path(sys.argv[1])
-    if not pdf_path.exists():
-        print(f"\n❌ PDF not found: {pdf_path}")
+    pdf_paths = [Path(arg) for arg in sys.argv[1:]]
+    missing = [pdf_path for pdf_path in pdf_paths if not pdf_path.exists()]
+    if missing:
+        print(f"\n❌ PDF not found: {', '.join(map(str, missing))}")
         return
 
-    paper_enhanced = example_llm_enhanced_parsing(pdf_path)
+    # One parser (and LLM client connection pool) for all PDFs
+    try:
+        ocr = create_ocr()
+    except Exception as e:
+        print(f"❌ Initialization failed: {e}")
+        return
 
-    if paper_enhanced:
-        output_path = pdf_path.parent / f"{pdf_path.stem}_parsed_enhanced.json"
-        example_save_to_json(paper_enhanced, output_path)
+    for pdf_path, paper_enhanced in example_llm_enhanced_parsing(pdf_paths, ocr):
+        if paper_enhanced:
+            output_path = pdf_path.parent / f"{pdf_path.stem}_parsed_enhanced.json"
+            example_save_to_json(paper_enhanced, output_path)
 
     print("\n✅ Completed!")
 
@@ -1,13 +1,17 @@
 """FlashRank reranking demo: paper relevance scoring with time-decay weighting.
 
-Mirrors the approach in alithia/paperscout/recommender.py
+Mirrors the approach in alithia/paperscout/reranker.py
 """
 
+import argparse
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import numpy as np
-from flashrank import Ranker, RerankRequest
+
+from alithia.paperscout.reranker import flashrank_score_matrix, get_flashrank_ranker, time_decay_weights
+from alithia.paperscout.score_cache import RerankScoreCache
 
 
 def create_sample_corpus() -> List[Dict[str, any]]:
@@ -84,14 +88,20 @@ def create_candidate_papers() -> List[Dict[str, str]]:
 
 
 def rerank_with_flashrank(
-    candidate_papers: List[Dict[str, str]], corpus: List[Dict[str, any]], model_name: str = "ms-marco-MiniLM-L-12-v2"
+    candidate_papers: List[Dict[str, str]],
+    corpus: List[Dict[str, any]],
+    model_name: str = "ms-marco-MiniLM-L-12-v2",
+    verbose: bool = False,
+    score_cache: Optional[RerankScoreCache] = None,
 ) -> List[Dict[str, any]]:
-    """Rerank papers by corpus relevance (mirrors alithia/paperscout/recommender.py).
+    """Rerank papers by corpus relevance (mirrors alithia/paperscout/reranker.py).
 
     Args:
         candidate_papers: Papers to rank
         corpus: User's research corpus
         model_name: FlashRank model
+        verbose: Print the corpus ordering, time decay weights and per-candidate relevance tables
+        score_cache: Persistent score cache; pairs scored in earlier runs skip the cross-encoder
 
     Returns:
         Papers with scores, sorted by relevance
@@ -100,80 +110,91 @@ def rerank_with_flashrank(
         return [{"paper": p, "score": 0.0} for p in candidate_papers]
 
     print(f"Initializing FlashRank: {model_name}")
-    ranker = Ranker(model_name=model_name, cache_dir="/tmp/flashrank_cache")
-
-    sorted_corpus = sorted(
-        corpus, key=lambda x: datetime.strptime(x["data"]["dateAdded"], "%Y-%m-%dT%H:%M:%SZ"), reverse=True
+    ranker = get_flashrank_ranker(model_name)
+
+    # ISO-8601 dateAdded strings sort chronologically as plain strings
+    sorted_corpus = sorted(corpus, key=lambda x: x["data"]["dateAdded"], reverse=True)
+    time_decay_weight = time_decay_weights(len(sorted_corpus))
+
+    # Score all candidates against all corpus abstracts in batched forward passes
+    relevance = flashrank_score_matrix(
+        ranker,
+        [paper["summary"] for paper in candidate_papers],
+        [paper["data"]["abstractNote"] for paper in sorted_corpus],
+        score_cache=score_cache,
+        model_name=model_name,
     )
+    final_scores = relevance @ time_decay_weight * 10
+    best_matches = relevance.argmax(axis=1)
 
-    print(f"\nCorpus (newest first):")
-    for i, paper in enumerate(sorted_corpus):
-        print(f"  {i+1}. {paper['data']['title']} ({paper['data']['dateAdded'][:10]})")
-
-    time_decay_weight = 1 / (1 + np.log10(np.arange(len(sorted_corpus)) + 1))
-    time_decay_weight = time_decay_weight / time_decay_weight.sum()
-
-    print(f"\nTime decay weights (sum={time_decay_weight.sum():.4f}):")
-    for i, weight in enumerate(time_decay_weight):
-        print(f"  Position {i+1}: {weight:.4f}")
+    if verbose:
+        print_rerank_details(candidate_papers, sorted_corpus, time_decay_weight, relevance, final_scores)
 
-    corpus_passages = [{"text": paper["data"]["abstractNote"]} for paper in sorted_corpus]
-    scored_papers = []
+    scored_papers = [
+        {
+            "paper": paper,
+            "score": float(final_score),
+            "corpus_similarity": float(final_score),
+            "corpus_size": len(corpus),
+            "top_match": sorted_corpus[best_match_idx]["data"]["title"],
+            "top_match_score": float(relevance[idx, best_match_idx]),
+        }
+        for idx, (paper, final_score, best_match_idx) in enumerate(zip(candidate_papers, final_scores, best_matches))
+    ]
 
-    print("\n" + "=" * 80)
-    print("RERANKING CANDIDATE PAPERS")
-    print("=" * 80)
+    scored_papers.sort(key=lambda x: x["score"], reverse=True)
+    return scored_papers
 
-    for idx, paper in enumerate(candidate_papers):
-        print(f"\n[{idx+1}/{len(candidate_papers)}] {paper['title']}")
-        print(f"Summary: {paper['summary'][:100]}...")
 
-        rerank_request = RerankRequest(query=paper["summary"], passages=corpus_passages)
-        results = ranker.rerank(rerank_request)
+def print_rerank_details(
+    candidate_papers: List[Dict[str, str]],
+    sorted_corpus: List[Dict[str, any]],
+    time_decay_weight: np.ndarray,
+    relevance: np.ndarray,
+    final_scores: np.ndarray,
+):
+    """Print the corpus ordering, time decay weights and per-candidate relevance tables in one write."""
+    lines = ["\nCorpus (newest first):"]
+    for i, paper in enumerate(sorted_corpus):
+        lines.append(f"  {i+1}. {paper['data']['title']} ({paper['data']['dateAdded'][:10]})")
 
-        weighted_scores = []
-        print(f"\nCorpus relevance:")
+    lines.append(f"\nTime decay weights (sum={time_decay_weight.sum():.4f}):")
+    for i, weight in enumerate(time_decay_weight):
+        lines.append(f"  Position {i+1}: {weight:.4f}")
 
-        text_to_idx = {paper["data"]["abstractNote"]: idx for idx, paper in enumerate(sorted_corpus)}
+    lines.extend(["\n" + "=" * 80, "RERANKING CANDIDATE PAPERS", "=" * 80])
 
-        for result in results:
-            relevance_score = result["score"]
-            corpus_idx = text_to_idx[result["text"]]
-            weighted_score = relevance_score * time_decay_weight[corpus_idx]
-            weighted_scores.append(weighted_score)
+    weighted = relevance * time_decay_weight
+    for idx, paper in enumerate(candidate_papers):
+        lines.append(f"\n[{idx+1}/{len(candidate_papers)}] {paper['title']}")
+        lines.append(f"Summary: {paper['summary'][:100]}...")
 
+        # Corpus papers by relevance to this candidate (highest first)
+        lines.append("\nCorpus relevance:")
+        for corpus_idx in np.argsort(-relevance[idx], kind="stable"):
             corpus_title = sorted_corpus[corpus_idx]["data"]["title"]
-            print(
+            lines.append(
                 f"  - {corpus_title[:50]:50s} | "
-                f"Relevance: {relevance_score:6.4f} | "
+                f"Relevance: {relevance[idx, corpus_idx]:6.4f} | "
                 f"Weight: {time_decay_weight[corpus_idx]:.4f} | "
-                f"Weighted: {weighted_score:.4f}"
+                f"Weighted: {weighted[idx, corpus_idx]:.4f}"
             )
 
-        final_score = sum(weighted_scores) * 10
-
-        print(f"\n  Total weighted: {sum(weighted_scores):.4f}")
-        print(f"  Final (×10): {final_score:.4f}")
-
-        best_match_idx = text_to_idx[results[0]["text"]]
+        lines.append(f"\n  Total weighted: {final_scores[idx] / 10:.4f}")
+        lines.append(f"  Final (×10): {final_scores[idx]:.4f}")
 
-        scored_papers.append(
-            {
-                "paper": paper,
-                "score": float(final_score),
-                "corpus_similarity": float(final_score),
-                "corpus_size": len(corpus),
-                "top_match": sorted_corpus[best_match_idx]["data"]["title"],
-                "top_match_score": results[0]["score"],
-            }
-        )
-
-    scored_papers.sort(key=lambda x: x["score"], reverse=True)
-    return scored_papers
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Run FlashRank demo."""
+    parser = argparse.ArgumentParser(description="FlashRank reranking demonstration")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show time decay weights and per-candidate corpus relevance"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the on-disk score cache")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("FLASHRANK RERANKING DEMONSTRATION")
     print("=" * 80)
@@ -192,7 +213,8 @@ def main():
     print("RERANKING PROCESS")
     print("=" * 80)
 
-    results = rerank_with_flashrank(candidates, corpus)
+    score_cache = None if args.no_cache else RerankScoreCache()
+    results = rerank_with_flashrank(candidates, corpus, verbose=args.verbose, score_cache=score_cache)
 
     print("\n" + "=" * 80)
     print("FINAL RANKING")
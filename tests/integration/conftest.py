@@ -0,0 +1,18 @@
+"""
+Shared fixtures for integration tests.
+
+ArXiv fetches that several tests inspect are module-scoped, so each distinct query
+costs one round of network requests (and ArXiv rate-limit waits) per test module
+instead of one per test.
+"""
+
+import pytest
+
+from alithia.utils.arxiv_paper_fetcher import ArxivPaperFetcher
+
+
+@pytest.fixture(scope="module")
+def rss_cs_ai_debug_result():
+    """RSS feed fetch of cs.AI in debug mode."""
+    fetcher = ArxivPaperFetcher(max_retries=2)
+    return fetcher.fetch_papers(arxiv_query="cs.AI", from_time=None, to_time=None, debug=True)
@@ -281,16 +281,9 @@ class TestArxivPaperFetcherRSSFeed:
         assert not result.success or result.strategy_used != FetchStrategy.RSS_FEED
 
     @pytest.mark.integration
-    def test_rss_feed_paper_metadata_completeness(self):
+    def test_rss_feed_paper_metadata_completeness(self, rss_cs_ai_debug_result):
         """Test that RSS feed returns complete paper metadata."""
-        fetcher = ArxivPaperFetcher(max_retries=2)
-
-        result = fetcher.fetch_papers(
-            arxiv_query="cs.AI",
-            from_time=None,
-            to_time=None,
-            debug=True,
-        )
+        result = rss_cs_ai_debug_result
 
         assert result.success
         assert result.strategy_used == FetchStrategy.RSS_FEED
@@ -456,16 +449,9 @@ class TestArxivPaperFetcherFallbackChain:
         assert result.strategy_used == FetchStrategy.API_SEARCH
 
     @pytest.mark.integration
-    def test_elapsed_time_tracking(self):
+    def test_elapsed_time_tracking(self, rss_cs_ai_debug_result):
         """Test that elapsed time is properly tracked."""
-        fetcher = ArxivPaperFetcher(max_retries=2)
-
-        result = fetcher.fetch_papers(
-            arxiv_query="cs.AI",
-            from_time=None,
-            to_time=None,
-            debug=True,
-        )
+        result = rss_cs_ai_debug_result
 
         assert result.success
         assert result.elapsed_time > 0
@@ -9,6 +9,7 @@ Tests cover:
 """
 
 from datetime import datetime
+from io import BytesIO
 from unittest.mock import Mock, patch
 
 import pytest
@@ -19,6 +20,7 @@ from alithia.utils.arxiv_paper_fetcher import (
     FetchResult,
     FetchStrategy,
     _build_category_query,
+    _parse_rss_new_ids,
     build_arxiv_search_query,
     fetch_arxiv_papers,
     get_arxiv_papers_feed,
@@ -112,6 +114,49 @@ def mock_arxiv_result():
     return result
 
 
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>cs.AI updates on arXiv.org</title>
+  <entry>
+    <id>oai:arXiv.org:2312.00001v1</id>
+    <title>First</title>
+    <arxiv:announce_type>new</arxiv:announce_type>
+  </entry>
+  <entry>
+    <id>oai:arXiv.org:2312.00002v2</id>
+    <title>Replaced</title>
+    <arxiv:announce_type>replace</arxiv:announce_type>
+  </entry>
+  <entry>
+    <id>oai:arXiv.org:2312.00003v1</id>
+    <title>Second</title>
+    <arxiv:announce_type>new</arxiv:announce_type>
+  </entry>
+</feed>
+"""
+
+
+@pytest.mark.unit
+def test_parse_rss_new_ids():
+    """Test extracting new paper IDs from an Atom feed."""
+    assert _parse_rss_new_ids(BytesIO(RSS_FEED), max_results=10) == ["2312.00001v1", "2312.00003v1"]
+
+
+@pytest.mark.unit
+def test_parse_rss_new_ids_stops_at_max_results():
+    """Test that parsing stops once max_results IDs are found."""
+    truncated = BytesIO(RSS_FEED[: RSS_FEED.index(b"<title>Replaced")])
+    assert _parse_rss_new_ids(truncated, max_results=1) == ["2312.00001v1"]
+
+
+@pytest.mark.unit
+def test_parse_rss_new_ids_feed_error():
+    """Test that a feed error title raises ValueError."""
+    feed = RSS_FEED.replace(b"cs.AI updates on arXiv.org", b"Feed error for query: cs.XX")
+    with pytest.raises(ValueError):
+        _parse_rss_new_ids(BytesIO(feed), max_results=10)
+
+
 # ============================================================================
 # ArxivPaperFetcher Class Tests
 # ============================================================================
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from alithia.utils import arxiv_web_scraper
 from alithia.utils.arxiv_web_scraper import ArxivWebScraper
 
 
@@ -19,6 +20,9 @@ def test_arxiv_web_scraper_initialization():
     assert scraper.base_url == "https://arxiv.org"
     assert scraper.session is not None
     assert scraper.session.headers["User-Agent"] == "TestAgent/1.0"
+    adapter = scraper.session.get_adapter("https://arxiv.org")
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
 
 
 @pytest.mark.unit
@@ -31,6 +35,16 @@ def test_arxiv_web_scraper_custom_session():
     assert scraper.session == custom_session
 
 
+@pytest.mark.unit
+def test_arxiv_web_scraper_response_cache(tmp_path, monkeypatch):
+    """Test the created session caches responses on disk when requests-cache is available."""
+    requests_cache = pytest.importorskip("requests_cache")
+    monkeypatch.setattr(arxiv_web_scraper, "DEFAULT_ARXIV_CACHE_DIR", str(tmp_path))
+
+    assert isinstance(ArxivWebScraper().session, requests_cache.CachedSession)
+    assert not isinstance(ArxivWebScraper(use_cache=False).session, requests_cache.CachedSession)
+
+
 @pytest.mark.unit
 def test_build_search_url_single_category():
     """Test building search URL with single category."""
@@ -280,6 +294,27 @@ def test_scrape_paper_details_error():
         assert paper is None
 
 
+@pytest.mark.unit
+def test_scrape_paper_details_many_keeps_order():
+    """Test scraping several papers returns results aligned with the IDs."""
+    scraper = ArxivWebScraper()
+
+    def fake_get(url, timeout=None):
+        arxiv_id = url.rsplit("/", 1)[-1]
+        if arxiv_id == "0000.00000":
+            raise Exception("Network error")
+        response = Mock()
+        response.text = f'<html><h1 class="title">Title:Paper {arxiv_id}</h1></html>'
+        return response
+
+    with patch.object(scraper.session, "get", side_effect=fake_get):
+        papers = scraper.scrape_paper_details_many(["2312.12345", "0000.00000", "2005.14165"])
+
+    assert papers[0].title == "Paper 2312.12345"
+    assert papers[1] is None
+    assert papers[2].arxiv_id == "2005.14165"
+
+
 @pytest.mark.unit
 def test_parse_search_results_empty():
     """Test parsing empty search results."""
@@ -297,6 +332,32 @@ def test_parse_search_results_empty():
     assert papers == []
 
 
+@pytest.mark.unit
+def test_parse_search_results_stops_at_limit():
+    """Test parsing search results entries, stopping at the limit."""
+    scraper = ArxivWebScraper()
+
+    entries = "".join(
+        f"""
+        <li class="arxiv-result">
+            <p class="list-title"><a href="https://arxiv.org/abs/2312.0000{i}">arXiv:2312.0000{i}</a></p>
+            <p class="title is-5 mathjax">Paper {i}</p>
+            <p class="authors"><a href="#">Alice</a>, <a href="#">Bob</a></p>
+            <p class="is-size-7">Submitted 2{i} December, 2023; Submitted 2{i} Dec 2023</p>
+        </li>"""
+        for i in range(1, 4)
+    )
+    mock_html = f'<html><nav><a href="/abs/9999.99999">x</a></nav><ol class="breathe-horizontal">{entries}</ol></html>'
+
+    papers = scraper._parse_search_results(mock_html, limit=2)
+
+    assert [paper.arxiv_id for paper in papers] == ["2312.00001", "2312.00002"]
+    assert papers[0].title == "Paper 1"
+    assert papers[0].authors == ["Alice", "Bob"]
+    assert papers[0].published_date == datetime(2023, 12, 21)
+    assert len(scraper._parse_search_results(mock_html)) == 3
+
+
 @pytest.mark.unit
 def test_scrape_arxiv_search_pagination():
     """Test that scraping makes only one request (no pagination support)."""
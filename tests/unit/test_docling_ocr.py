@@ -0,0 +1,176 @@
+"""
+Unit tests for the docling PDF parser.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from alithia.paperlens.paper_ocr.docling import LLM_MAX_CHARS, DoclingOcr
+from alithia.paperlens.paper_ocr.extraction_cache import ExtractionCache
+
+
+class FakeDocument:
+    def __init__(self, text, title=None):
+        self.text = text
+        self.title = title
+
+    def export_to_markdown(self):
+        return self.text
+
+
+class FakeConverter:
+    """Converter stub returning one document per requested page range."""
+
+    def __init__(self):
+        self.page_ranges = []
+        self.sources = []
+
+    def convert(self, source, page_range=(1, 10**9)):
+        self.page_ranges.append(page_range)
+        self.sources.append((source.name, source.stream.read()))
+        start, end = page_range
+        end = min(end, 5)
+        text = " ".join(f"page {i}" for i in range(start, end + 1))
+        return SimpleNamespace(document=FakeDocument(text, title="Title" if start == 1 else None))
+
+
+class FakeLLM:
+    """LLM stub returning fixed metadata."""
+
+    chat_model = "fake"
+
+    def __init__(self):
+        self.prompts = []
+
+    def structured_completion(self, messages, response_model, **kwargs):
+        self.prompts.append(messages[-1]["content"])
+        return response_model(title="LLM Title", authors=["Alice"], abstract="LLM abstract")
+
+
+@pytest.fixture
+def ocr(monkeypatch):
+    ocr = DoclingOcr(page_batch_size=2)
+    ocr.converter = FakeConverter()
+    monkeypatch.setattr(DoclingOcr, "_get_page_count", staticmethod(lambda file_path: 5))
+    return ocr
+
+
+@pytest.mark.unit
+def test_parse_file_converts_long_pdfs_in_page_batches(ocr, tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4")
+
+    paper = ocr.parse_file(path)
+
+    assert ocr.converter.page_ranges == [(1, 2), (3, 4), (5, 5)]
+    assert ocr.converter.sources == [("paper.pdf", b"%PDF-1.4")] * 3
+    assert paper.content.full_text == "page 1 page 2\n\npage 3 page 4\n\npage 5"
+    assert paper.paper_metadata.title == "Title"
+
+
+@pytest.mark.unit
+def test_parse_file_converts_short_pdfs_at_once(ocr, tmp_path):
+    ocr.page_batch_size = 10
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4")
+
+    paper = ocr.parse_file(path)
+
+    assert ocr.converter.page_ranges == [(1, 10**9)]
+    assert paper.content.full_text == "page 1 page 2 page 3 page 4 page 5"
+
+
+@pytest.mark.unit
+def test_parse_file_reuses_extraction_cache(ocr, tmp_path):
+    ocr.extraction_cache = ExtractionCache(tmp_path / "cache")
+    first = tmp_path / "paper.pdf"
+    first.write_bytes(b"%PDF-1.4")
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(b"%PDF-1.4")
+
+    parsed = ocr.parse_file(first)
+    cached = ocr.parse_file(copy)
+
+    assert len(ocr.converter.page_ranges) == 3
+    assert cached.content.full_text == parsed.content.full_text
+    assert cached.paper_metadata.title == "Title"
+    assert cached.file_metadata.file_name == "copy.pdf"
+
+
+@pytest.mark.unit
+def test_extraction_cache_key_includes_settings(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    key = {"content_hash": "abc", "llm": None}
+
+    assert cache._entry_path(key) == cache._entry_path(dict(reversed(list(key.items()))))
+    assert cache._entry_path(key) != cache._entry_path({"content_hash": "abc", "llm": "model"})
+    assert cache.get(key) is None
+
+
+@pytest.mark.unit
+def test_parse_file_without_llm_defers_enhancement(ocr, tmp_path):
+    ocr.llm = FakeLLM()
+    ocr.extraction_cache = ExtractionCache(tmp_path / "cache")
+    paths = []
+    for name in ("a.pdf", "b.pdf"):
+        paths.append(tmp_path / name)
+        paths[-1].write_bytes(name.encode())
+
+    results = [ocr.parse_file_without_llm(path) for path in paths]
+    assert [needs_llm for _, needs_llm in results] == [True, True]
+    assert ocr.llm.prompts == []
+
+    papers = [paper for paper, _ in results]
+    ocr.enhance_metadata_with_llm(papers)
+
+    assert len(ocr.llm.prompts) == 2
+    assert all(len(prompt) < LLM_MAX_CHARS + 1000 for prompt in ocr.llm.prompts)
+    # Docling metadata takes precedence over the LLM's
+    assert [p.paper_metadata.title for p in papers] == ["Title", "Title"]
+    assert [p.paper_metadata.authors for p in papers] == [["Alice"], ["Alice"]]
+
+    cached, needs_llm = ocr.parse_file_without_llm(paths[0])
+    assert not needs_llm
+    assert cached.paper_metadata.abstract == "LLM abstract"
+
+
+@pytest.mark.unit
+def test_llm_extraction_retries_with_validation_feedback(ocr, monkeypatch):
+    monkeypatch.setattr("alithia.paperlens.paper_ocr.docling.LLM_RETRY_DELAY", 0)
+
+    class FlakyLLM(FakeLLM):
+        def structured_completion(self, messages, response_model, **kwargs):
+            if not self.prompts:
+                self.prompts.append(messages[-1]["content"])
+                response_model(year="not a year")
+            return super().structured_completion(messages, response_model, **kwargs)
+
+    ocr.llm = FlakyLLM()
+
+    metadata = ocr._extract_metadata_with_llm("paper text")
+
+    assert metadata.title == "LLM Title"
+    assert len(ocr.llm.prompts) == 2
+    assert ocr.llm.prompts[1].startswith("Your output had error:")
+
+
+@pytest.mark.unit
+def test_llm_extraction_retries_transient_errors(ocr, monkeypatch):
+    monkeypatch.setattr("alithia.paperlens.paper_ocr.docling.LLM_RETRY_DELAY", 0)
+
+    class FlakyLLM(FakeLLM):
+        def structured_completion(self, messages, response_model, **kwargs):
+            if not self.prompts:
+                self.prompts.append(messages[-1]["content"])
+                raise TimeoutError("Request timed out")
+            return super().structured_completion(messages, response_model, **kwargs)
+
+    ocr.llm = FlakyLLM()
+
+    metadata = ocr._extract_metadata_with_llm("paper text")
+
+    assert metadata.title == "LLM Title"
+    # The request is repeated unchanged, without validation feedback
+    assert len(ocr.llm.prompts) == 2
+    assert ocr.llm.prompts[0] == ocr.llm.prompts[1]
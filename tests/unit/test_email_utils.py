@@ -1,8 +1,11 @@
+import smtplib
+
 import pytest
 
 from alithia.models import ArxivPaper
 from alithia.paperscout.email import create_empty_email_html, create_paper_html, get_stars_html
 from alithia.paperscout.models import ScoredPaper
+from alithia.utils.email_utils import EmailSender, send_email
 
 
 @pytest.mark.unit
@@ -40,3 +43,57 @@ def test_create_paper_html_includes_fields():
     assert "arXiv ID" in html
     assert "Relevance" in html
     assert "Code" in html
+
+
+class FakeSMTP:
+    """SMTP stub recording connections and delivered messages."""
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.logins = 0
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def ehlo(self):
+        pass
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def send_message(self, msg, from_addr=None, to_addrs=None):
+        self.sent.append((from_addr, to_addrs, msg))
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+@pytest.mark.unit
+def test_email_sender_reuses_connection(fake_smtp):
+    with EmailSender("me@example.com", "secret", "smtp.example.com", 587) as sender:
+        sender.send("a@example.com", "<p>a</p>", subject="First")
+        sender.send("b@example.com", "<p>b</p>")
+
+    assert len(fake_smtp.instances) == 1
+    server = fake_smtp.instances[0]
+    assert server.logins == 1
+    assert [to for _, to, _ in server.sent] == [["a@example.com"], ["b@example.com"]]
+    assert server.sent[0][2]["To"].endswith("<a@example.com>")
+    assert server.closed
+
+
+@pytest.mark.unit
+def test_send_email_rejects_incomplete_config(fake_smtp):
+    assert not send_email("", "a@example.com", "secret", "smtp.example.com", 587, "<p>a</p>")
+    assert fake_smtp.instances == []
@@ -0,0 +1,61 @@
+import hashlib
+
+import pytest
+
+from alithia.utils import file_utils
+from alithia.utils.file_utils import compute_bytes_hash, compute_file_hash, iter_files
+
+
+@pytest.mark.unit
+def test_compute_file_hash_is_stable_across_chunk_sizes(tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4\n" + bytes(range(256)) * 1000)
+
+    assert compute_file_hash(path) == compute_file_hash(path, chunk_size=7)
+    assert compute_file_hash(path) == compute_bytes_hash(path.read_bytes())
+
+
+@pytest.mark.unit
+def test_compute_file_hash_differs_for_different_content(tmp_path):
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_bytes(b"first")
+    b.write_bytes(b"second")
+
+    assert compute_file_hash(a) != compute_file_hash(b)
+
+
+@pytest.mark.unit
+def test_compute_file_hash_falls_back_to_blake2b(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_utils, "blake3", None)
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"content")
+
+    assert compute_file_hash(path) == hashlib.blake2b(b"content", digest_size=32).hexdigest()
+
+
+@pytest.mark.unit
+def test_iter_files_filters_by_suffix_size_and_hidden(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"x" * 10)
+    (tmp_path / "UPPER.PDF").write_bytes(b"x" * 10)
+    (tmp_path / "empty.pdf").write_bytes(b"")
+    (tmp_path / "big.pdf").write_bytes(b"x" * 100)
+    (tmp_path / "notes.txt").write_bytes(b"x" * 10)
+    (tmp_path / ".hidden.pdf").write_bytes(b"x" * 10)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.pdf").write_bytes(b"x" * 10)
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / ".cache" / "c.pdf").write_bytes(b"x" * 10)
+
+    found = {p.relative_to(tmp_path).as_posix() for p in iter_files(tmp_path, ".pdf", min_size=1, max_size=50)}
+
+    assert found == {"a.pdf", "UPPER.PDF", "sub/b.pdf"}
+
+
+@pytest.mark.unit
+def test_iter_files_non_recursive(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.pdf").write_bytes(b"x")
+
+    assert list(iter_files(tmp_path, ".pdf", recursive=False)) == [tmp_path / "a.pdf"]
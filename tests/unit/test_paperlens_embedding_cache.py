@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from alithia.paperlens.embedding_cache import EmbeddingCache
+
+
+@pytest.mark.unit
+def test_embedding_cache_roundtrip(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    vectors = {"hash-a": np.array([0.1, 0.2, 0.3]), "hash-b": np.array([1.0, 0.0, -1.0])}
+    cache.put_many("model", vectors)
+
+    found = cache.get_many("model", ["hash-a", "hash-b", "hash-missing"])
+
+    assert set(found) == {"hash-a", "hash-b"}
+    np.testing.assert_allclose(found["hash-a"], vectors["hash-a"], rtol=1e-6)
+    assert found["hash-b"].dtype == np.float32
+
+
+@pytest.mark.unit
+def test_embedding_cache_is_keyed_by_model(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    cache.put_many("model-a", {"hash": np.ones(4)})
+
+    assert cache.get_many("model-b", ["hash"]) == {}
+
+
+@pytest.mark.unit
+def test_embedding_cache_persists_across_instances(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    cache.put_many("model", {"hash": np.arange(3)})
+    cache.close()
+
+    found = EmbeddingCache(tmp_path).get_many("model", ["hash"])
+
+    np.testing.assert_array_equal(found["hash"], np.arange(3, dtype=np.float32))
+
+
+@pytest.mark.unit
+def test_embedding_cache_int8_quantization(tmp_path):
+    rng = np.random.default_rng(0)
+    vector = rng.standard_normal(384).astype(np.float32)
+    cache = EmbeddingCache(tmp_path, quantize=True)
+    cache.put_many("model", {"hash": vector, "zero": np.zeros(384)})
+
+    found = cache.get_many("model", ["hash", "zero"])
+
+    cosine = found["hash"] @ vector / (np.linalg.norm(found["hash"]) * np.linalg.norm(vector))
+    assert found["hash"].dtype == np.float32
+    assert cosine > 0.999
+    np.testing.assert_array_equal(found["zero"], np.zeros(384, dtype=np.float32))
@@ -0,0 +1,140 @@
+"""
+Unit tests for the PaperLens engine.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from alithia.paperlens.engine import PaperLensEngine
+from alithia.paperlens.models import AcademicPaper, FileMetadata, PaperContent, PaperMetadata
+
+
+class FakeOcr:
+    """Parser stub that records which files it was asked to parse."""
+
+    def __init__(self):
+        self.parsed = []
+
+    def parse_file_without_llm(self, file_path, content_hash=None):
+        self.parsed.append(file_path.name)
+        paper = AcademicPaper(
+            file_metadata=FileMetadata(
+                file_path=file_path,
+                file_name=file_path.name,
+                file_size=file_path.stat().st_size,
+                last_modified=datetime.now(),
+                content_hash=content_hash,
+            ),
+            paper_metadata=PaperMetadata(title=file_path.stem),
+            content=PaperContent(full_text=file_path.read_text()),
+        )
+        return paper, False
+
+    def enhance_metadata_with_llm(self, papers):
+        assert papers == []
+
+
+class FakeModel:
+    """Embedding model stub mapping texts to fixed 3-d vectors."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return np.array([[len(text), text.count("a"), 1.0] for text in texts], dtype=np.float32)
+
+
+def make_paper(name, text):
+    return AcademicPaper(
+        file_metadata=FileMetadata(
+            file_path=Path(f"/papers/{name}.pdf"),
+            file_name=f"{name}.pdf",
+            file_size=len(text),
+            last_modified=datetime(2024, 1, 1),
+            content_hash=f"hash-{name}",
+        ),
+        paper_metadata=PaperMetadata(title=name),
+        content=PaperContent(full_text=text),
+    )
+
+
+@pytest.fixture
+def engine():
+    engine = PaperLensEngine(use_embedding_cache=False, use_topic_cache=False)
+    engine.ocr = FakeOcr()
+    return engine
+
+
+@pytest.mark.unit
+def test_scan_pdf_directory_parses_duplicates_once(engine, tmp_path):
+    (tmp_path / "paper.pdf").write_text("same content")
+    (tmp_path / "paper (1).pdf").write_text("same content")
+    (tmp_path / "other.pdf").write_text("other content")
+
+    papers = engine.scan_pdf_directory(tmp_path, max_workers=1)
+
+    assert len(engine.ocr.parsed) == 2
+    assert sorted(p.file_metadata.file_name for p in papers) == ["other.pdf", "paper (1).pdf", "paper.pdf"]
+    duplicates = [p for p in papers if p.content.full_text == "same content"]
+    assert duplicates[0].file_metadata.content_hash == duplicates[1].file_metadata.content_hash
+    assert duplicates[0].paper_metadata is not duplicates[1].paper_metadata
+
+
+@pytest.mark.unit
+def test_scan_pdf_directory_missing_directory(engine, tmp_path):
+    assert engine.scan_pdf_directory(tmp_path / "missing") == []
+
+
+@pytest.mark.unit
+def test_score_papers_reuses_corpus_embeddings(engine):
+    engine.model = FakeModel()
+    papers = [make_paper("a", "aaaa"), make_paper("b", "bbbbbbbb"), make_paper("c", "abab")]
+
+    first = engine.score_papers("aaa", papers)
+    encoded_after_first = len(engine.model.encoded)
+    second = engine.score_papers("bbb", papers)
+
+    # Only the new topic is encoded the second time
+    assert len(engine.model.encoded) == encoded_after_first + 1
+    assert first.shape == second.shape == (3,)
+    assert np.all(np.abs(first) <= 1.0 + 1e-6)
+
+
+@pytest.mark.unit
+def test_score_papers_weights_field_similarities(engine):
+    engine.model = FakeModel()
+    paper = make_paper("a", "bbbb")
+    paper.paper_metadata.abstract = "ab"
+
+    score = engine.score_papers("aaa", [paper])[0]
+
+    def unit(text):
+        vector = FakeModel().encode([text])[0]
+        return vector / np.linalg.norm(vector)
+
+    topic = unit("aaa")
+    expected = (3 * unit("a") @ topic + 2 * unit("ab") @ topic + unit("bbbb") @ topic) / 6
+    assert score == pytest.approx(expected, rel=1e-5)
+
+
+@pytest.mark.unit
+def test_search_returns_top_papers_with_scores(engine):
+    engine.model = FakeModel()
+    papers = [make_paper("a", "aaaa"), make_paper("b", "bbbbbbbb"), make_paper("c", "abab")]
+    scores = engine.score_papers("aaa", papers)
+
+    top = engine.search("aaa", papers, top_n=2)
+
+    expected = [papers[i].file_metadata.file_name for i in np.argsort(-scores)[:2]]
+    assert [p.file_metadata.file_name for p in top] == expected
+    assert top[0].similarity_score >= top[1].similarity_score
+
+
+@pytest.mark.unit
+def test_topic_cache_is_opt_in(tmp_path):
+    assert PaperLensEngine(cache_dir=tmp_path).topic_cache is None
+    assert PaperLensEngine(cache_dir=tmp_path, use_topic_cache=True).topic_cache is not None
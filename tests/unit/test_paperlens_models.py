@@ -0,0 +1,120 @@
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from alithia.paperlens import models
+from alithia.paperlens.models import AcademicPaper, FileMetadata, PaperContent, PaperMetadata, normalize_doi
+
+
+def make_paper(title=None, abstract=None, full_text=""):
+    return AcademicPaper(
+        file_metadata=FileMetadata(
+            file_path=Path("/papers/paper.pdf"),
+            file_name="paper.pdf",
+            file_size=1024,
+            last_modified=datetime(2024, 1, 1),
+        ),
+        paper_metadata=PaperMetadata(title=title, abstract=abstract),
+        content=PaperContent(full_text=full_text),
+    )
+
+
+@pytest.mark.unit
+def test_get_searchable_text_is_deprecated():
+    paper = make_paper(title="Title", abstract="Abstract", full_text="body")
+
+    with pytest.warns(DeprecationWarning):
+        assert paper.get_searchable_text() == "Title Title Title Abstract Abstract body"
+
+
+@pytest.mark.unit
+def test_paper_content_full_text_roundtrip():
+    content = PaperContent(full_text="markdown " * 1000)
+
+    assert content.full_text == "markdown " * 1000
+    assert content.model_dump()["full_text"] == "markdown " * 1000
+    assert PaperContent.model_validate(content.model_dump()).full_text == content.full_text
+
+    content.full_text = "updated"
+    assert content.model_copy(deep=True).full_text == "updated"
+
+
+@pytest.mark.unit
+def test_file_metadata_md5_hash_is_deprecated_alias():
+    metadata = FileMetadata.model_validate(
+        {
+            "file_path": "/papers/paper.pdf",
+            "file_name": "paper.pdf",
+            "file_size": 1024,
+            "last_modified": "2024-01-01T00:00:00",
+            "md5_hash": "abc",
+        }
+    )
+
+    assert metadata.content_hash == "abc"
+    with pytest.warns(DeprecationWarning):
+        assert metadata.md5_hash == "abc"
+    assert "md5_hash" not in metadata.model_dump()
+
+
+@pytest.mark.unit
+def test_get_field_texts():
+    paper = make_paper(title="Title", full_text="x" * 5000)
+    paper.paper_metadata.keywords = ["nlp", "retrieval"]
+
+    assert paper.get_field_texts() == {
+        "title": "Title",
+        "abstract": "",
+        "keywords": "nlp, retrieval",
+        "body": "x" * 4000,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_bytes_matches_to_dict(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(models, "orjson", None)
+    elif models.orjson is None:
+        pytest.skip("orjson is not installed")
+    paper = make_paper(title="Tïtle", abstract="Abstract", full_text="body")
+
+    assert json.loads(paper.to_json_bytes()) == paper.to_dict()
+    assert json.loads(paper.to_json_bytes(indent=True)) == paper.to_dict()
+    assert b'\n  "file_metadata": {' in paper.to_json_bytes(indent=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_streams_same_json(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr(models, "orjson", None)
+    elif models.orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(models, "FULL_TEXT_CHUNK_BYTES", 7)
+    paper = make_paper(title="Tïtle", abstract="Abstract", full_text='Bödy "quoted"\n' * 50)
+
+    for indent in (False, True):
+        out = io.BytesIO()
+        paper.write_json(out, indent=indent)
+        assert out.getvalue() == paper.to_json_bytes(indent=indent)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "doi, expected",
+    [
+        ("10.1145/3290605.3300857", "10.1145/3290605.3300857"),
+        (" https://doi.org/10.48550/arXiv.1706.03762 ", "10.48550/arXiv.1706.03762"),
+        ("doi:10.1000/xyz123.", "10.1000/xyz123"),
+        ("not a doi", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_normalize_doi(doi, expected):
+    assert normalize_doi(doi) == expected
+    assert PaperMetadata(doi=doi).doi == expected
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from alithia.paperlens.topic_cache import TopicCache
+
+
+@pytest.mark.unit
+def test_topic_cache_hit_for_similar_topic(tmp_path):
+    cache = TopicCache(tmp_path, threshold=0.87)
+    cache.store("model", "corpus", np.array([1.0, 0.0, 0.0]), np.array([0.5, 0.25]))
+
+    scores = cache.lookup("model", "corpus", np.array([0.95, 0.1, 0.0]))
+
+    np.testing.assert_allclose(scores, [0.5, 0.25])
+
+
+@pytest.mark.unit
+def test_topic_cache_miss_below_threshold(tmp_path):
+    cache = TopicCache(tmp_path, threshold=0.87)
+    cache.store("model", "corpus", np.array([1.0, 0.0, 0.0]), np.array([0.5]))
+
+    assert cache.lookup("model", "corpus", np.array([0.5, 0.5, 0.5])) is None
+
+
+@pytest.mark.unit
+def test_topic_cache_miss_for_other_corpus(tmp_path):
+    cache = TopicCache(tmp_path)
+    cache.store("model", "corpus-a", np.array([1.0, 0.0]), np.array([0.5]))
+
+    assert cache.lookup("model", "corpus-b", np.array([1.0, 0.0])) is None
+
+
+@pytest.mark.unit
+def test_topic_cache_evicts_least_recently_used(tmp_path):
+    cache = TopicCache(tmp_path, max_entries=2)
+    cache.store("model", "corpus", np.array([1.0, 0.0, 0.0]), np.array([1.0]))
+    cache.store("model", "corpus", np.array([0.0, 1.0, 0.0]), np.array([2.0]))
+    cache.lookup("model", "corpus", np.array([1.0, 0.0, 0.0]))
+    cache.store("model", "corpus", np.array([0.0, 0.0, 1.0]), np.array([3.0]))
+
+    assert cache.lookup("model", "corpus", np.array([1.0, 0.0, 0.0])) is not None
+    assert cache.lookup("model", "corpus", np.array([0.0, 1.0, 0.0])) is None
@@ -0,0 +1,53 @@
+"""
+Unit tests for the per-host rate limiter.
+"""
+
+import pytest
+
+from alithia.utils import rate_limiter
+from alithia.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock stub whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.mark.unit
+def test_rate_limiter_spaces_requests_per_host(clock):
+    limiter = RateLimiter(3.0)
+
+    limiter.wait("arxiv.org")
+    limiter.wait("export.arxiv.org")
+    limiter.wait("arxiv.org")
+
+    assert clock.sleeps == [3.0]
+
+
+@pytest.mark.unit
+def test_rate_limiter_does_not_wait_after_idle_period(clock):
+    limiter = RateLimiter(3.0)
+
+    limiter.wait("arxiv.org")
+    clock.now += 10
+    limiter.wait("arxiv.org")
+
+    assert clock.sleeps == []
@@ -2,6 +2,7 @@
 Unit tests for the paper reranker module.
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -9,7 +10,15 @@ import pytest
 
 from alithia.models import ArxivPaper
 from alithia.paperscout.models import ScoredPaper
-from alithia.paperscout.reranker import PaperReranker
+from alithia.paperscout.reranker import (
+    PaperReranker,
+    flashrank_pair_scores,
+    flashrank_score_matrix,
+    get_flashrank_ranker,
+    lexical_top_k,
+    time_decay_weights,
+)
+from alithia.paperscout.score_cache import RerankScoreCache
 
 
 @pytest.fixture
@@ -351,6 +360,224 @@ def test_rerank_sentence_transformer_batch_size(sample_papers, sample_corpus):
         assert all(call[1].get("batch_size") == 16 for call in encode_calls)
 
 
+class FakeEncoding:
+    def __init__(self, ids):
+        self.ids = ids
+        self.type_ids = [0] * len(ids)
+        self.attention_mask = [1] * len(ids)
+
+
+class FakeTokenizer:
+    """Tokenizer stub encoding each (query, passage) pair as padded word lengths."""
+
+    def encode_batch(self, pairs):
+        ids = [[len(word) for word in f"{query} {passage}".split()] for query, passage in pairs]
+        width = max(len(row) for row in ids)
+        return [FakeEncoding(row + [0] * (width - len(row))) for row in ids]
+
+
+class FakeSession:
+    """ONNX session stub returning one logit per pair."""
+
+    def __init__(self, input_names=("input_ids", "attention_mask")):
+        self.input_names = input_names
+        self.batch_sizes = []
+        self.input_keys = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name=name) for name in self.input_names]
+
+    def run(self, output_names, onnx_input):
+        input_ids = onnx_input["input_ids"]
+        self.batch_sizes.append(len(input_ids))
+        self.input_keys.append(set(onnx_input))
+        return [(input_ids.sum(axis=1, keepdims=True) % 7 - 3).astype(np.float32)]
+
+
+def make_fake_ranker():
+    flashrank = pytest.importorskip("flashrank")
+    ranker = object.__new__(flashrank.Ranker)
+    ranker.llm_model = None
+    ranker.logger = Mock()
+    ranker.tokenizer = FakeTokenizer()
+    ranker.session = FakeSession()
+    return ranker
+
+
+@pytest.mark.unit
+def test_flashrank_score_matrix_matches_rerank():
+    """Test that batched scoring matches per-query Ranker.rerank scores."""
+    from flashrank import RerankRequest
+
+    ranker = make_fake_ranker()
+    queries = ["deep learning models", "vision", "graph neural networks for molecules"]
+    passages = ["transformers are attention models", "convolutions", "molecules and graphs"]
+
+    matrix = flashrank_score_matrix(ranker, queries, passages, batch_size=4)
+
+    assert matrix.shape == (3, 3)
+    assert ranker.session.batch_sizes == [4, 4, 1]
+    for query, row in zip(queries, matrix):
+        results = ranker.rerank(RerankRequest(query=query, passages=[{"text": passage} for passage in passages]))
+        expected = {result["text"]: result["score"] for result in results}
+        assert row == pytest.approx([expected[passage] for passage in passages], rel=1e-6)
+
+
+@pytest.mark.unit
+def test_flashrank_pair_scores_sends_token_type_ids_only_when_declared():
+    """Test that token_type_ids follow the session's declared inputs."""
+    pairs = [["query", "first passage"], ["query", "second passage"]]
+
+    ranker = make_fake_ranker()
+    flashrank_pair_scores(ranker, pairs)
+    assert ranker.session.input_keys == [{"input_ids", "attention_mask"}]
+
+    ranker.session = FakeSession(input_names=("input_ids", "attention_mask", "token_type_ids"))
+    flashrank_pair_scores(ranker, pairs)
+    assert ranker.session.input_keys == [{"input_ids", "attention_mask", "token_type_ids"}]
+
+
+@pytest.mark.unit
+def test_rerank_flashrank_weights_scores_by_time_decay(sample_papers, sample_corpus):
+    """Test FlashRank reranking scores papers against the newest-first corpus."""
+    ranker = make_fake_ranker()
+    reranker = PaperReranker(sample_papers, sample_corpus)
+
+    with patch("alithia.paperscout.reranker.get_flashrank_ranker", return_value=ranker):
+        result = reranker.rerank_flashrank()
+
+    newest_first = [item["data"]["abstractNote"] for item in reversed(sample_corpus)]
+    relevance = flashrank_score_matrix(ranker, [paper.summary for paper in sample_papers], newest_first)
+    weights = 1 / (1 + np.log10(np.arange(3) + 1))
+    expected = relevance @ (weights / weights.sum()) * 10
+
+    assert [scored.score for scored in result] == pytest.approx(sorted(expected, reverse=True), rel=1e-6)
+    assert all(scored.relevance_factors["corpus_size"] == 3 for scored in result)
+
+
+@pytest.mark.unit
+def test_flashrank_score_matrix_scores_only_uncached_pairs(tmp_path):
+    """Test that pairs found in the score cache skip the cross-encoder."""
+    ranker = make_fake_ranker()
+    score_cache = RerankScoreCache(tmp_path)
+    queries = ["deep learning models", "vision"]
+    passages = ["transformers are attention models", "convolutions"]
+    flashrank_pair_scores(ranker, [[queries[0], passages[1]]], score_cache=score_cache, model_name="model")
+    ranker.session.batch_sizes.clear()
+
+    matrix = flashrank_score_matrix(ranker, queries, passages, score_cache=score_cache, model_name="model")
+
+    assert ranker.session.batch_sizes == [3]
+    assert matrix == pytest.approx(flashrank_score_matrix(ranker, queries, passages), rel=1e-6)
+    ranker.session.batch_sizes.clear()
+    flashrank_score_matrix(ranker, queries, passages, score_cache=RerankScoreCache(tmp_path), model_name="model")
+    assert ranker.session.batch_sizes == []
+    assert score_cache.get_many("other-model", [RerankScoreCache.pair_key(queries[0], passages[0])]) == {}
+
+
+@pytest.mark.unit
+def test_flashrank_score_matrix_scores_duplicates_once():
+    """Test that duplicate queries and passages are sent to the cross-encoder once."""
+    ranker = make_fake_ranker()
+    queries = ["deep learning models", "vision", "deep learning models"]
+    passages = ["convolutions", "transformers are attention models", "convolutions"]
+
+    matrix = flashrank_score_matrix(ranker, queries, passages)
+
+    assert ranker.session.batch_sizes == [4]
+    expected = flashrank_score_matrix(ranker, queries[:2], passages[:2])
+    assert matrix == pytest.approx(expected[np.ix_([0, 1, 0], [0, 1, 0])], rel=1e-6)
+
+
+@pytest.mark.unit
+def test_lexical_top_k_selects_most_similar_passages():
+    """Test TF-IDF first-stage selection of passages per query."""
+    passages = ["cats purr softly", "dogs bark loudly", "cats and dogs play", "stock markets fell"]
+
+    selected = lexical_top_k(["quiet cats", "markets"], passages, top_k=2)
+
+    assert selected.shape == (2, 2)
+    assert set(selected[0]) == {0, 2}
+    assert 3 in selected[1]
+
+
+@pytest.mark.unit
+def test_rerank_flashrank_top_k_scores_selected_abstracts(sample_papers, sample_corpus):
+    """Test that top_k reranking scores each paper against its lexically closest abstracts only."""
+    ranker = make_fake_ranker()
+    reranker = PaperReranker(sample_papers, sample_corpus)
+
+    with patch("alithia.paperscout.reranker.get_flashrank_ranker", return_value=ranker):
+        result = reranker.rerank_flashrank(top_k=1)
+
+    # One pair per paper reaches the cross-encoder
+    assert ranker.session.batch_sizes == [3]
+    newest_first = [item["data"]["abstractNote"] for item in reversed(sample_corpus)]
+    queries = [paper.summary for paper in sample_papers]
+    selected = lexical_top_k(queries, newest_first, top_k=1)
+    relevance = flashrank_score_matrix(ranker, queries, newest_first)
+    expected = relevance[np.arange(3), selected[:, 0]] * 10
+    assert [scored.score for scored in result] == pytest.approx(sorted(expected, reverse=True), rel=1e-6)
+
+
+@pytest.mark.unit
+def test_rerank_flashrank_rejects_top_k_below_one(sample_papers, sample_corpus):
+    """Test that top_k < 1 is rejected instead of producing NaN scores."""
+    reranker = PaperReranker(sample_papers, sample_corpus)
+
+    with pytest.raises(ValueError):
+        reranker.rerank_flashrank(top_k=0)
+    with pytest.raises(ValueError):
+        lexical_top_k(["cats"], ["cats purr"], top_k=0)
+
+
+@pytest.mark.unit
+def test_rerank_flashrank_top_k_falls_back_on_empty_vocabulary(sample_papers, sample_corpus):
+    """Test that corpus abstracts without any terms are scored against the whole corpus."""
+    for item, abstract in zip(sample_corpus, ["", "the and of", ""]):
+        item["data"]["abstractNote"] = abstract
+    ranker = make_fake_ranker()
+    reranker = PaperReranker(sample_papers, sample_corpus)
+
+    with patch("alithia.paperscout.reranker.get_flashrank_ranker", return_value=ranker):
+        result = reranker.rerank_flashrank(top_k=1)
+
+    newest_first = [item["data"]["abstractNote"] for item in reversed(sample_corpus)]
+    queries = [paper.summary for paper in sample_papers]
+    expected = flashrank_score_matrix(ranker, queries, newest_first) @ time_decay_weights(3) * 10
+    assert [scored.score for scored in result] == pytest.approx(sorted(expected, reverse=True), rel=1e-6)
+
+
+@pytest.mark.unit
+def test_get_flashrank_ranker_loads_each_model_once():
+    """Test that FlashRank rankers are cached per model."""
+    pytest.importorskip("flashrank")
+    get_flashrank_ranker.cache_clear()
+
+    with patch("flashrank.Ranker", side_effect=lambda **kwargs: Mock(**kwargs)) as mock_ranker:
+        first = get_flashrank_ranker("model-a")
+        assert get_flashrank_ranker("model-a") is first
+        assert get_flashrank_ranker("model-b") is not first
+
+    assert mock_ranker.call_count == 2
+    get_flashrank_ranker.cache_clear()
+
+
+@pytest.mark.unit
+def test_time_decay_weights_and_sorted_corpus_are_cached(sample_papers, sample_corpus):
+    """Test that corpus ordering and time decay weights are computed once."""
+    weights = time_decay_weights(3)
+    assert time_decay_weights(3) is weights
+    assert weights.sum() == pytest.approx(1.0)
+    assert np.all(np.diff(weights) < 0)
+    assert not weights.flags.writeable
+
+    reranker = PaperReranker(sample_papers, sample_corpus)
+    assert reranker.sorted_corpus is reranker.sorted_corpus
+    dates = [item["data"]["dateAdded"] for item in reranker.sorted_corpus]
+    assert dates == sorted(dates, reverse=True)
+
+
 @pytest.mark.unit
 def test_scored_paper_updates_paper_score():
     """Test that ScoredPaper updates the paper's score field."""
@@ -1,5 +1,7 @@
 """Test state persistence across LangGraph nodes."""
 
+from dataclasses import asdict
+
 import pytest
 
 from alithia.paperscout.state import AgentState, PaperScoutConfig
@@ -49,8 +51,7 @@ def test_error_log_accumulation(sample_config):
     state.add_error("Error 2")
 
     assert len(state.error_log) == 2
-    assert "Error 1" in state.error_log[0]
-    assert "Error 2" in state.error_log[1]
+    assert [record.message for record in state.error_log] == ["Error 1", "Error 2"]
 
 
 def test_performance_metrics_accumulation(sample_config):
@@ -73,7 +74,7 @@ def test_state_dict_conversion(sample_config):
     state.update_metric("test_metric", 1.0)
 
     # Convert to dict (mimicking what LangGraph does)
-    state_dict = state.model_dump()
+    state_dict = asdict(state)
 
     assert "error_log" in state_dict
     assert "performance_metrics" in state_dict
@@ -92,7 +93,7 @@ def test_node_return_format(sample_config):
     # Verify the return format includes error_log
     assert "error_log" in return_dict
     assert len(return_dict["error_log"]) == 1
-    assert "Node error" in return_dict["error_log"][0]
+    assert return_dict["error_log"][0].message == "Node error"
 
 
 def test_state_summary(sample_config):
@@ -109,3 +110,15 @@ def test_state_summary(sample_config):
     assert summary["current_step"] == "testing"
     assert summary["errors"] == 1
     assert "papers_processed" in summary["metrics"]
+
+
+def test_error_record_formats_timestamp_lazily(sample_config):
+    """Test that error entries keep the message and render with an ISO timestamp."""
+    state = AgentState(config=sample_config)
+    state.add_error("Formatted error")
+
+    record = state.error_log[0]
+
+    assert record.message == "Formatted error"
+    assert str(record).endswith(": Formatted error")
+    assert str(record)[:4].isdigit()